@@ -0,0 +1,54 @@
+from __future__ import print_function, division
+import time
+
+import numpy as np
+import imgaug as ia
+import imgaug.augmenters as iaa
+
+
+def main():
+    image = ia.imresize_single_image(ia.data.quokka(), (512, 512))
+    images = np.stack([image] * 16)
+
+    def _create_chain():
+        return [
+            iaa.AddToHue((-20, 20)),
+            iaa.MultiplySaturation((0.5, 1.5)),
+            iaa.MultiplyAndAddToBrightness(),
+            iaa.ChangeColorTemperature((4000, 9000)),
+            iaa.Grayscale((0.0, 0.5))
+        ]
+
+    for lut_size in [17, 33, 65]:
+        aug_unfused = iaa.Sequential(_create_chain())
+        aug_unfused.seed_(1)
+        aug_fused = iaa.FusedColorLUT(
+            iaa.Sequential(_create_chain()), lut_size=lut_size)
+        aug_fused.children.seed_(1)
+        # warm up, e.g. to compile numba functions
+        _ = aug_fused.deepcopy()(images=np.copy(images[0:1]))
+
+        times = []
+        for aug in [aug_unfused, aug_fused]:
+            time_start = time.time()
+            images_aug = aug(images=np.copy(images))
+            times.append(time.time() - time_start)
+            if aug is aug_unfused:
+                images_unfused = images_aug
+            else:
+                images_fused = images_aug
+
+        diff = np.abs(
+            images_unfused.astype(np.int32) - images_fused.astype(np.int32))
+        print(
+            "lut_size=%2d | unfused: %.4fs | fused: %.4fs | "
+            "mean error: %.3f | p99 error: %.1f | max error: %d" % (
+                lut_size, times[0], times[1], np.mean(diff),
+                np.percentile(diff, 99), np.max(diff)))
+
+    ia.imshow(ia.draw_grid(list(images_unfused[0:4]) + list(images_fused[0:4]),
+                           rows=2))
+
+
+if __name__ == "__main__":
+    main()
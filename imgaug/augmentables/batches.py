@@ -441,21 +441,17 @@ class Batch(object):
             The converted batch.
 
         """
-        def _copy(var):
-            # TODO first check here if _aug is set and if it is then use that?
-            if var is not None:
-                return utils.copy_augmentables(var)
-            return var
-
-        return _BatchInAugmentation(
-            images=_copy(self.images_unaug),
-            heatmaps=_copy(self.heatmaps_unaug),
-            segmentation_maps=_copy(self.segmentation_maps_unaug),
-            keypoints=_copy(self.keypoints_unaug),
-            bounding_boxes=_copy(self.bounding_boxes_unaug),
-            polygons=_copy(self.polygons_unaug),
-            line_strings=_copy(self.line_strings_unaug)
-        )
+        # TODO first check here if _aug is set and if it is then use that?
+        batch = _BatchInAugmentation()
+        for augm_name in _AUGMENTABLE_NAMES:
+            value = getattr(self, augm_name + "_unaug")
+            if value is not None:
+                # The values are copied lazily on first access. This batch
+                # counts as a second owner that never releases its value,
+                # hence the _BatchInAugmentation always receives a copy.
+                batch._set_shared_column_value(
+                    augm_name, _SharedColumnValue(value, nb_owners=2))
+        return batch
 
     def fill_from_batch_in_augmentation_(self, batch_in_augmentation):
         """Set the columns in this batch to the column values of another batch.
@@ -631,6 +627,69 @@ class _BatchInAugmentationPropagationContext(object):
                 self.batch.invert_apply_propagation_hooks_(self.noned_info)
 
 
+# Added in 0.5.0.
+class _SharedColumnValue(object):
+    """Column value that is shared copy-on-write between multiple batches.
+
+    Each batch sharing the value counts as one owner. Reading the value
+    from a batch requires a private copy as long as other owners exist.
+    The last remaining owner receives the value without copying.
+
+    Added in 0.5.0.
+
+    """
+
+    def __init__(self, value, nb_owners=1):
+        self.value = value
+        self.nb_owners = nb_owners
+
+    def acquire(self):
+        self.nb_owners += 1
+        return self
+
+    def release(self):
+        self.nb_owners -= 1
+
+    def materialize(self):
+        self.nb_owners -= 1
+        if self.nb_owners <= 0:
+            return self.value
+        return utils.copy_augmentables(self.value)
+
+
+# Added in 0.5.0.
+class _CopyOnWriteColumn(object):
+    """Descriptor for a column of :class:`_BatchInAugmentation`.
+
+    The descriptor stores the raw column value in ``_<name>``. If that
+    value is a :class:`_SharedColumnValue`, it is materialized (i.e.
+    copied if still shared) on first access, so that callers may modify
+    the returned value in-place.
+
+    Added in 0.5.0.
+
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.storage_name = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = obj.__dict__.get(self.storage_name)
+        if isinstance(value, _SharedColumnValue):
+            value = value.materialize()
+            obj.__dict__[self.storage_name] = value
+        return value
+
+    def __set__(self, obj, value):
+        old_value = obj.__dict__.get(self.storage_name)
+        if isinstance(old_value, _SharedColumnValue):
+            old_value.release()
+        obj.__dict__[self.storage_name] = value
+
+
 class _BatchInAugmentation(object):
     """
     Class encapsulating a batch during the augmentation process.
@@ -664,8 +723,32 @@ class _BatchInAugmentation(object):
     line_strings : None or list of imgaug.augmentables.lines.LineStringsOnImage
         The line strings to augment.
 
+    Attributes
+    ----------
+    images_colorspaces : None or list of None or tuple of str
+        Deferred colorspace conversions of the images. Either ``None`` (no
+        deferred conversions) or one entry per image. Each entry is either
+        ``None`` or a tuple ``(current colorspace, target colorspace)``,
+        denoting that the image's pixels are currently in the first
+        colorspace and still have to be converted to the second one.
+        Augmenters that are aware of this attribute may use it to avoid
+        redundant colorspace conversions, e.g. ``RGB -> HSV -> RGB -> HSV``.
+        All other augmenters receive images with deferred conversions
+        already applied, see
+        :func:`_BatchInAugmentation.apply_deferred_colorspaces_`.
+
+        Added in 0.5.0.
+
     """
 
+    images = _CopyOnWriteColumn("images")
+    heatmaps = _CopyOnWriteColumn("heatmaps")
+    segmentation_maps = _CopyOnWriteColumn("segmentation_maps")
+    keypoints = _CopyOnWriteColumn("keypoints")
+    bounding_boxes = _CopyOnWriteColumn("bounding_boxes")
+    polygons = _CopyOnWriteColumn("polygons")
+    line_strings = _CopyOnWriteColumn("line_strings")
+
     # Added in 0.4.0.
     def __init__(self, images=None, heatmaps=None, segmentation_maps=None,
                  keypoints=None, bounding_boxes=None, polygons=None,
@@ -679,6 +762,7 @@ class _BatchInAugmentation(object):
         self.polygons = polygons
         self.line_strings = line_strings
         self.data = data
+        self.images_colorspaces = None
 
     @property
     def empty(self):
@@ -711,11 +795,67 @@ class _BatchInAugmentation(object):
 
         """
         for augm_name in _AUGMENTABLE_NAMES:
-            value = getattr(self, augm_name)
+            value = self._peek_column_value(augm_name)
             if value is not None:
                 return len(value)
         return 0
 
+    def _peek_column_value(self, augm_name):
+        """Get a column's value without materializing shared copies.
+
+        The returned value must not be modified.
+
+        Added in 0.5.0.
+
+        """
+        value = self.__dict__.get("_" + augm_name)
+        if isinstance(value, _SharedColumnValue):
+            return value.value
+        return value
+
+    def _set_shared_column_value(self, augm_name, shared):
+        """Set a column to a value shared with other batches.
+
+        Added in 0.5.0.
+
+        """
+        setattr(self, augm_name, None)
+        self.__dict__["_" + augm_name] = shared
+
+    def _detach_column_values_(self):
+        """Set all columns to ``None`` without materializing shared copies.
+
+        The detached raw values can be put back into the batch via
+        :func:`_BatchInAugmentation._reattach_column_values_`.
+
+        Added in 0.5.0.
+
+        Returns
+        -------
+        dict of str to object
+            Raw column values (possibly still shared with other batches)
+            of all columns that contained data.
+
+        """
+        detached = {}
+        for augm_name in _AUGMENTABLE_NAMES:
+            storage_name = "_" + augm_name
+            value = self.__dict__.get(storage_name)
+            if value is not None:
+                detached[augm_name] = value
+                self.__dict__[storage_name] = None
+        return detached
+
+    def _reattach_column_values_(self, detached):
+        """Put raw column values back that were previously detached.
+
+        Added in 0.5.0.
+
+        """
+        for augm_name, value in detached.items():
+            setattr(self, augm_name, None)
+            self.__dict__["_" + augm_name] = value
+
     @property
     def columns(self):
         """Get the columns of data to augment.
@@ -748,7 +888,12 @@ class _BatchInAugmentation(object):
             Names of types of augmentables. E.g. ``["images", "polygons"]``.
 
         """
-        return _get_column_names(self, "")
+        result = []
+        for augm_name in _AUGMENTABLE_NAMES:
+            value = self._peek_column_value(augm_name)
+            if value is not None and len(value) > 0:
+                result.append(augm_name)
+        return result
 
     def get_rowwise_shapes(self):
         """Get the shape of each row within this batch.
@@ -769,14 +914,16 @@ class _BatchInAugmentation(object):
 
         """
         nb_rows = self.nb_rows
-        columns = self.columns
         shapes = [None] * nb_rows
         found = np.zeros((nb_rows,), dtype=bool)
-        for column in columns:
-            if column.name == "images" and ia.is_np_array(column.value):
-                shapes = [column.value.shape[1:]] * nb_rows
+        for augm_name in self.get_column_names():
+            # Only shapes are read here, hence shared values do not have
+            # to be copied.
+            value = self._peek_column_value(augm_name)
+            if augm_name == "images" and ia.is_np_array(value):
+                shapes = [value.shape[1:]] * nb_rows
             else:
-                for i, item in enumerate(column.value):
+                for i, item in enumerate(value):
                     if item is not None:
                         shapes[i] = item.shape
                         found[i] = True
@@ -813,7 +960,11 @@ class _BatchInAugmentation(object):
                     rows = None
             kwargs[augm_name] = rows
 
-        return _BatchInAugmentation(**kwargs)
+        batch = _BatchInAugmentation(**kwargs)
+        if self.images_colorspaces is not None and len(indices) > 0:
+            batch.images_colorspaces = [self.images_colorspaces[index]
+                                        for index in indices]
+        return batch
 
     def invert_subselect_rows_by_indices_(self, indices, batch_subselected):
         """Reverse the subselection of rows in-place.
@@ -885,6 +1036,17 @@ class _BatchInAugmentation(object):
                     for ith_index, index in enumerate(indices):
                         column[index] = column_sub[ith_index]  # pylint: disable=unsupported-assignment-operation
 
+        cspaces = self.images_colorspaces
+        cspaces_sub = batch_subselected.images_colorspaces
+        if cspaces is not None or cspaces_sub is not None:
+            if cspaces is None:
+                cspaces = [None] * self.nb_rows
+            for ith_index, index in enumerate(indices):
+                cspaces[index] = (cspaces_sub[ith_index]
+                                  if cspaces_sub is not None
+                                  else None)
+            self.images_colorspaces = cspaces
+
         return self
 
     def propagation_hooks_ctx(self, augmenter, hooks, parents):
@@ -1018,6 +1180,7 @@ class _BatchInAugmentation(object):
         if batch_in_augmentation is self:
             return self
 
+        self.images_colorspaces = batch_in_augmentation.images_colorspaces
         self.images = batch_in_augmentation.images
         self.heatmaps = batch_in_augmentation.heatmaps
         self.segmentation_maps = batch_in_augmentation.segmentation_maps
@@ -1048,6 +1211,7 @@ class _BatchInAugmentation(object):
             instance.
 
         """
+        self.apply_deferred_colorspaces_()
         batch = Batch(
             images=batch_before_aug.images_unaug,
             heatmaps=batch_before_aug.heatmaps_unaug,
@@ -1070,6 +1234,13 @@ class _BatchInAugmentation(object):
     def deepcopy(self):
         """Copy this batch and all of its column values.
 
+        The column values are copied lazily (copy-on-write). They are shared
+        between this batch and the copy until a column is accessed in one
+        of the two batches, at which point that batch receives its own copy
+        of the column. Columns that are never accessed in a batch are
+        hence never copied, and the last batch still sharing a column
+        receives it without copying.
+
         Added in 0.4.0.
 
         Returns
@@ -1081,8 +1252,44 @@ class _BatchInAugmentation(object):
         batch = _BatchInAugmentation(data=utils.deepcopy_fast(self.data))
 
         for augm_name in _AUGMENTABLE_NAMES:
-            value = getattr(self, augm_name)
+            storage_name = "_" + augm_name
+            value = self.__dict__.get(storage_name)
             if value is not None:
-                setattr(batch, augm_name, utils.copy_augmentables(value))
+                if not isinstance(value, _SharedColumnValue):
+                    value = _SharedColumnValue(value)
+                    self.__dict__[storage_name] = value
+                batch.__dict__[storage_name] = value.acquire()
+
+        if self.images_colorspaces is not None:
+            batch.images_colorspaces = list(self.images_colorspaces)
 
         return batch
+
+    def apply_deferred_colorspaces_(self):
+        """Apply all deferred colorspace conversions of the images in-place.
+
+        See the attribute ``images_colorspaces`` for details.
+
+        Added in 0.5.0.
+
+        Returns
+        -------
+        _BatchInAugmentation
+            The updated batch. (Modified in-place.)
+
+        """
+        cspaces = self.images_colorspaces
+        if cspaces is None:
+            return self
+
+        # imported here to avoid circular imports
+        from ..augmenters.color import change_colorspace_
+
+        self.images_colorspaces = None
+        images = self.images
+        for i, cspace in enumerate(cspaces):
+            if cspace is not None:
+                images[i] = change_colorspace_(
+                    images[i], to_colorspace=cspace[1],
+                    from_colorspace=cspace[0])
+        return self
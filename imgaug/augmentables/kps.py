@@ -10,6 +10,7 @@ from .base import IAugmentable
 from .utils import (
     normalize_imglike_shape,
     project_coords,
+    project_coords_,
     _remove_out_of_image_fraction_,
     _handle_on_image_shape
 )
@@ -724,8 +725,10 @@ class KeypointsOnImage(IAugmentable):
             self.shape = on_shape  # channels may differ
             return self
 
-        for i, kp in enumerate(self.keypoints):
-            self.keypoints[i] = kp.project_(self.shape, on_shape)
+        if self.keypoints:
+            xy_proj = project_coords_(self.to_xy_array(), self.shape,
+                                      on_shape)
+            self.fill_from_xy_array_(xy_proj)
         self.shape = on_shape
         return self
 
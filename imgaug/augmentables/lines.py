@@ -16,7 +16,8 @@ from .utils import (
     interpolate_points,
     _remove_out_of_image_fraction_,
     _normalize_shift_args,
-    _handle_on_image_shape
+    _handle_on_image_shape,
+    _RaggedCoordinates
 )
 
 
@@ -1687,6 +1688,12 @@ class LineStringsOnImage(IAugmentable):
     >>> ]
     >>> lsoi = LineStringsOnImage(lss, shape=image.shape)
 
+    Alternatively, the line strings can be provided as a single array of
+    all points and an array of offsets, see
+    :func:`LineStringsOnImage.from_ragged_xy_array`. ``LineString`` objects
+    are then only created when :attr:`LineStringsOnImage.line_strings` is
+    accessed.
+
     """
 
     def __init__(self, line_strings, shape):
@@ -1697,9 +1704,49 @@ class LineStringsOnImage(IAugmentable):
             "Expected iterable of LineString, got types: %s." % (
                 ", ".join([str(type(v)) for v in line_strings])
             ))
+        self._ragged = None
         self.line_strings = line_strings
         self.shape = _handle_on_image_shape(shape, self)
 
+    @property
+    def line_strings(self):
+        """Get the line strings in this container.
+
+        If the container was created from a ragged array, the line strings
+        are created upon the first access. Their coordinates are views of
+        the ragged array's coordinates.
+
+        Added in 0.5.0.
+
+        Returns
+        -------
+        list of LineString
+            Line strings within this container.
+
+        """
+        if self._line_strings is None:
+            ragged = self._ragged
+            self._line_strings = [
+                LineString(ragged.get_item_coords(i), label=ragged.labels[i])
+                for i in range(len(ragged))]
+            self._ragged = None
+        return self._line_strings
+
+    @line_strings.setter
+    def line_strings(self, value):
+        """Set the line strings in this container.
+
+        Added in 0.5.0.
+
+        Parameters
+        ----------
+        value : list of LineString
+            Line strings within this container.
+
+        """
+        self._line_strings = value
+        self._ragged = None
+
     @property
     def items(self):
         """Get the line strings in this container.
@@ -1738,7 +1785,7 @@ class LineStringsOnImage(IAugmentable):
             ``True`` if this object contains zero line strings.
 
         """
-        return len(self.line_strings) == 0
+        return len(self) == 0
 
     def on_(self, image):
         """Project the line strings from one image shape to a new one in-place.
@@ -1765,8 +1812,12 @@ class LineStringsOnImage(IAugmentable):
             self.shape = on_shape  # channels may differ
             return self
 
-        for i, item in enumerate(self.items):
-            self.line_strings[i] = item.project_(self.shape, on_shape)
+        if self._ragged is not None:
+            self._ragged.coords = project_coords_(self._ragged.coords,
+                                                  self.shape, on_shape)
+        else:
+            for i, item in enumerate(self.items):
+                self.line_strings[i] = item.project_(self.shape, on_shape)
         self.shape = on_shape
         return self
 
@@ -1841,6 +1892,83 @@ class LineStringsOnImage(IAugmentable):
         return [iadt.restore_dtypes_(np.copy(ls.coords), dtype)
                 for ls in self.line_strings]
 
+    @classmethod
+    def from_ragged_xy_array(cls, xy, offsets, shape, labels=None):
+        """Create line strings from one array of points and an offsets array.
+
+        The points are stored in a single array. ``LineString`` objects are
+        only created when :attr:`LineStringsOnImage.line_strings` is
+        accessed. Coordinate-based methods such as ``to_xy_array()``,
+        ``fill_from_xy_array_()``, ``shift_()``, ``on_()`` and the
+        conversion to keypoints operate directly on the array until then.
+
+        This is the inverse of
+        :func:`~imgaug.augmentables.lines.LineStringsOnImage.to_ragged_xy_array`.
+
+        Added in 0.5.0.
+
+        Parameters
+        ----------
+        xy : (P,2) ndarray
+            Coordinates of all ``P`` points of all line strings. The array
+            is copied and converted to ``float32``.
+
+        offsets : (N+1,) ndarray
+            Start index of each line string's points in `xy`, followed by
+            ``P``. The coordinates of line string ``i`` are
+            ``xy[offsets[i]:offsets[i+1]]``.
+
+        shape : tuple of int
+            The shape of the image on which the line strings are placed.
+
+        labels : None or list of None or str, optional
+            Label of each line string.
+
+        Returns
+        -------
+        imgaug.augmentables.lines.LineStringsOnImage
+            Container of the ``N`` line strings.
+
+        """
+        ragged = _RaggedCoordinates(np.array(xy, dtype=np.float32),
+                                    offsets, labels)
+        return cls._from_ragged(ragged, shape)
+
+    def to_ragged_xy_array(self):
+        """Convert the line strings to one array of points and offsets.
+
+        This is the inverse of
+        :func:`~imgaug.augmentables.lines.LineStringsOnImage.from_ragged_xy_array`.
+
+        Added in 0.5.0.
+
+        Returns
+        -------
+        (P,2) ndarray
+            ``float32`` array of all points of all line strings.
+
+        (N+1,) ndarray
+            Start index of each line string's points in the points array,
+            followed by ``P``.
+
+        """
+        ragged = self._get_ragged()
+        return np.copy(ragged.coords), np.copy(ragged.offsets)
+
+    def _get_ragged(self):
+        if self._ragged is not None:
+            return self._ragged
+        return _RaggedCoordinates.from_arrays(
+            [ls.coords for ls in self.line_strings],
+            [ls.label for ls in self.line_strings])
+
+    @classmethod
+    def _from_ragged(cls, ragged, shape):
+        lsoi = LineStringsOnImage([], shape)
+        lsoi._line_strings = None
+        lsoi._ragged = ragged
+        return lsoi
+
     def draw_on_image(self, image,
                       color=(0, 255, 0), color_lines=None, color_points=None,
                       alpha=1.0, alpha_lines=None, alpha_points=None,
@@ -2102,6 +2230,10 @@ class LineStringsOnImage(IAugmentable):
             The object and its items may have been modified in-place.
 
         """
+        if self._ragged is not None:
+            self._ragged.coords += np.float32([x, y])
+            return self
+
         for i, ls in enumerate(self.line_strings):
             self.line_strings[i] = ls.shift_(x=x, y=y)
         return self
@@ -2163,6 +2295,8 @@ class LineStringsOnImage(IAugmentable):
             instance.
 
         """
+        if self._ragged is not None:
+            return np.copy(self._ragged.coords)
         if self.empty:
             return np.zeros((0, 2), dtype=np.float32)
         return np.concatenate([ls.coords for ls in self.line_strings])
@@ -2198,6 +2332,15 @@ class LineStringsOnImage(IAugmentable):
             "Expected input array to have shape (N,2), "
             "got shape %s." % (xy.shape,))
 
+        if self._ragged is not None:
+            assert len(xy) == self._ragged.nb_points, (
+                "Expected to get exactly as many xy-coordinates as there are "
+                "points in all line strings within this instance. "
+                "Got %d points, expected %d points." % (
+                    len(xy), self._ragged.nb_points))
+            self._ragged.coords[...] = xy.reshape((-1, 2))
+            return self
+
         counter = 0
         for ls in self.line_strings:
             nb_points = len(ls.coords)
@@ -2235,10 +2378,7 @@ class LineStringsOnImage(IAugmentable):
         from . import KeypointsOnImage
         if self.empty:
             return KeypointsOnImage([], shape=self.shape)
-        coords = np.concatenate(
-            [ls.coords for ls in self.line_strings],
-            axis=0)
-        return KeypointsOnImage.from_xy_array(coords,
+        return KeypointsOnImage.from_xy_array(self.to_xy_array(),
                                               shape=self.shape)
 
     def invert_to_keypoints_on_image_(self, kpsoi):
@@ -2262,6 +2402,15 @@ class LineStringsOnImage(IAugmentable):
             Note that the instance is also updated in-place.
 
         """
+        if self._ragged is not None:
+            assert len(kpsoi.keypoints) == self._ragged.nb_points, (
+                "Expected %d coordinates, got %d." % (
+                    self._ragged.nb_points, len(kpsoi.keypoints)))
+            if len(kpsoi.keypoints) > 0:
+                self._ragged.coords[...] = kpsoi.to_xy_array()
+            self.shape = kpsoi.shape
+            return self
+
         lss = self.line_strings
         coordss = [ls.coords for ls in lss]
         nb_points_exp = sum([len(coords) for coords in coordss])
@@ -2302,11 +2451,13 @@ class LineStringsOnImage(IAugmentable):
             Shallow copy.
 
         """
-        if line_strings is None:
-            line_strings = self.line_strings[:]
         if shape is None:
             # use tuple() here in case the shape was provided as a list
             shape = tuple(self.shape)
+        if line_strings is None and self._ragged is not None:
+            return self._from_ragged(self._ragged.copy(), shape)
+        if line_strings is None:
+            line_strings = self.line_strings[:]
 
         return LineStringsOnImage(line_strings, shape)
 
@@ -2334,11 +2485,13 @@ class LineStringsOnImage(IAugmentable):
 
         """
         # Manual copy is far faster than deepcopy, so use manual copy here.
-        if line_strings is None:
-            line_strings = [ls.deepcopy() for ls in self.line_strings]
         if shape is None:
             # use tuple() here in case the shape was provided as a list
             shape = tuple(self.shape)
+        if line_strings is None and self._ragged is not None:
+            return self._from_ragged(self._ragged.deepcopy(), shape)
+        if line_strings is None:
+            line_strings = [ls.deepcopy() for ls in self.line_strings]
 
         return LineStringsOnImage(line_strings, shape)
 
@@ -2381,6 +2534,8 @@ class LineStringsOnImage(IAugmentable):
             Number of items in this instance.
 
         """
+        if self._ragged is not None:
+            return len(self._ragged)
         return len(self.items)
 
     def __repr__(self):
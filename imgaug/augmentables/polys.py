@@ -1,7 +1,6 @@
 """Classes dealing with polygons."""
 from __future__ import print_function, division, absolute_import
 
-import traceback
 import collections
 
 import numpy as np
@@ -19,7 +18,8 @@ from .utils import (
     _remove_out_of_image_fraction_,
     project_coords_,
     _normalize_shift_args,
-    _handle_on_image_shape
+    _handle_on_image_shape,
+    _RaggedCoordinates
 )
 
 
@@ -56,6 +56,12 @@ def recover_psois_(psois, psois_orig, recoverer, random_state):
         psois_orig = [psois_orig]
 
     for i, psoi in enumerate(psois):
+        # Polygons stored as a ragged array are only converted to Polygon
+        # objects if any of them has to be repaired.
+        # pylint: disable=protected-access
+        if psoi._ragged is not None and np.all(psoi.compute_validity()):
+            continue
+
         for j, polygon in enumerate(psoi.polygons):
             poly_rec = recoverer.recover_from(
                 polygon.exterior, psois_orig[i].polygons[j],
@@ -233,6 +239,8 @@ class Polygon(object):
         """
         if len(self.exterior) < 3:
             return False
+        if _is_polygon_convex(self.exterior):
+            return True
         return self.to_shapely_polygon().is_valid
 
     @property
@@ -247,8 +255,8 @@ class Polygon(object):
         """
         if len(self.exterior) < 3:
             return 0.0
-        poly = self.to_shapely_polygon()
-        return poly.area
+        coords, offsets = _convert_exteriors_to_ragged([self.exterior])
+        return float(_compute_ragged_polygon_areas(coords, offsets)[0])
 
     @property
     def height(self):
@@ -589,67 +597,17 @@ class Polygon(object):
             return [self.deepcopy(exterior=ls_clipped[0].coords)]
 
         h, w = image.shape[0:2] if ia.is_np_array(image) else image[0:2]
+
+        # convex polygons can be clipped significantly faster without
+        # shapely
+        if _is_polygon_convex(self.exterior):
+            return _clip_convex_polygons_out_of_image([self], h, w)[0]
+
         poly_shapely = self.to_shapely_polygon()
         poly_image = shapely.geometry.Polygon([(0, 0), (w, 0), (w, h), (0, h)])
         multipoly_inter_shapely = poly_shapely.intersection(poly_image)
-        ignore_types = (shapely.geometry.LineString,
-                        shapely.geometry.MultiLineString,
-                        shapely.geometry.point.Point,
-                        shapely.geometry.MultiPoint)
-        if isinstance(multipoly_inter_shapely, shapely.geometry.Polygon):
-            multipoly_inter_shapely = shapely.geometry.MultiPolygon(
-                [multipoly_inter_shapely])
-        elif isinstance(multipoly_inter_shapely,
-                        shapely.geometry.MultiPolygon):
-            # we got a multipolygon from shapely, no need to change anything
-            # anymore
-            pass
-        elif isinstance(multipoly_inter_shapely, ignore_types):
-            # polygons that become (one or more) lines/points after clipping
-            # are here ignored
-            multipoly_inter_shapely = shapely.geometry.MultiPolygon([])
-        elif isinstance(multipoly_inter_shapely,
-                        shapely.geometry.GeometryCollection):
-            # Shapely returns GEOMETRYCOLLECTION EMPTY if there is nothing
-            # remaining after the clip.
-            assert multipoly_inter_shapely.is_empty
-            return []
-        else:
-            raise Exception(
-                "Got an unexpected result of type %s from Shapely for "
-                "image (%d, %d) and polygon %s. This is an internal error. "
-                "Please report." % (
-                    type(multipoly_inter_shapely), h, w, self.exterior)
-            )
-
-        polygons = []
-        for poly_inter_shapely in multipoly_inter_shapely.geoms:
-            polygons.append(Polygon.from_shapely(poly_inter_shapely,
-                                                 label=self.label))
-
-        # Shapely changes the order of points, we try here to preserve it as
-        # much as possible.
-        # Note here, that all points of the new polygon might have high
-        # distance to the points on the old polygon. This can happen if the
-        # polygon overlaps with the image plane, but all of its points are
-        # outside of the image plane. The new polygon will not be made up of
-        # any of the old points.
-        polygons_reordered = []
-        for polygon in polygons:
-            best_idx = None
-            best_dist = None
-            for x, y in self.exterior:
-                point_idx, dist = polygon.find_closest_point_index(
-                    x=x, y=y, return_distance=True)
-                if best_idx is None or dist < best_dist:
-                    best_idx = point_idx
-                    best_dist = dist
-            if best_idx is not None:
-                polygon_reordered = \
-                    polygon.change_first_point_by_index(best_idx)
-                polygons_reordered.append(polygon_reordered)
-
-        return polygons_reordered
+        return _convert_shapely_clip_result_to_polygons(
+            multipoly_inter_shapely, self, h, w)
 
     def shift_(self, x=0, y=0):
         """Move this polygon along the x/y-axis in-place.
@@ -1451,12 +1409,57 @@ class PolygonsOnImage(IAugmentable):
     >>> ]
     >>> polys_oi = PolygonsOnImage(polys, shape=image.shape)
 
+    Alternatively, the polygons can be provided as a single array of
+    all points and an array of offsets, see
+    :func:`PolygonsOnImage.from_ragged_xy_array`. ``Polygon`` objects are
+    then only created when :attr:`PolygonsOnImage.polygons` is accessed.
+
     """
 
     def __init__(self, polygons, shape):
+        self._ragged = None
         self.polygons = polygons
         self.shape = _handle_on_image_shape(shape, self)
 
+    @property
+    def polygons(self):
+        """Get the polygons in this container.
+
+        If the container was created from a ragged array, the polygons are
+        created upon the first access. Their exteriors are views of the
+        ragged array's coordinates.
+
+        Added in 0.5.0.
+
+        Returns
+        -------
+        list of Polygon
+            Polygons within this container.
+
+        """
+        if self._polygons is None:
+            ragged = self._ragged
+            self._polygons = [
+                Polygon(ragged.get_item_coords(i), label=ragged.labels[i])
+                for i in sm.xrange(len(ragged))]
+            self._ragged = None
+        return self._polygons
+
+    @polygons.setter
+    def polygons(self, value):
+        """Set the polygons in this container.
+
+        Added in 0.5.0.
+
+        Parameters
+        ----------
+        value : list of Polygon
+            Polygons within this container.
+
+        """
+        self._polygons = value
+        self._ragged = None
+
     @property
     def items(self):
         """Get the polygons in this container.
@@ -1495,7 +1498,85 @@ class PolygonsOnImage(IAugmentable):
             ``True`` if this object contains zero polygons.
 
         """
-        return len(self.polygons) == 0
+        return len(self) == 0
+
+    @classmethod
+    def from_ragged_xy_array(cls, xy, offsets, shape, labels=None):
+        """Create polygons from one array of points and an offsets array.
+
+        The points are stored in a single array. ``Polygon`` objects are
+        only created when :attr:`PolygonsOnImage.polygons` is accessed.
+        Coordinate-based methods such as ``to_xy_array()``,
+        ``fill_from_xy_array_()``, ``shift_()``, ``on_()`` and the
+        conversion to keypoints operate directly on the array until then.
+
+        This is the inverse of
+        :func:`~imgaug.augmentables.polys.PolygonsOnImage.to_ragged_xy_array`.
+
+        Added in 0.5.0.
+
+        Parameters
+        ----------
+        xy : (P,2) ndarray
+            Coordinates of all ``P`` points of all polygons. The array is
+            copied and converted to ``float32``.
+
+        offsets : (N+1,) ndarray
+            Start index of each polygon's points in `xy`, followed by ``P``.
+            The exterior of polygon ``i`` is ``xy[offsets[i]:offsets[i+1]]``.
+
+        shape : tuple of int
+            The shape of the image on which the polygons are placed.
+
+        labels : None or list of None or str, optional
+            Label of each polygon.
+
+        Returns
+        -------
+        imgaug.augmentables.polys.PolygonsOnImage
+            Container of the ``N`` polygons.
+
+        """
+        ragged = _RaggedCoordinates(np.array(xy, dtype=np.float32),
+                                    offsets, labels)
+        return cls._from_ragged(ragged.remove_closing_points_(), shape)
+
+    def to_ragged_xy_array(self):
+        """Convert the polygons to one array of points and an offsets array.
+
+        This is the inverse of
+        :func:`~imgaug.augmentables.polys.PolygonsOnImage.from_ragged_xy_array`.
+
+        Added in 0.5.0.
+
+        Returns
+        -------
+        (P,2) ndarray
+            ``float32`` array of all points of all polygons.
+
+        (N+1,) ndarray
+            Start index of each polygon's points in the points array,
+            followed by ``P``.
+
+        """
+        ragged = self._get_ragged()
+        return np.copy(ragged.coords), np.copy(ragged.offsets)
+
+    def _get_ragged(self):
+        if self._ragged is not None:
+            return self._ragged
+        return _RaggedCoordinates.from_arrays(
+            [poly.exterior for poly in self.polygons],
+            [poly.label for poly in self.polygons])
+
+    def _get_ragged_exteriors(self):
+        # float64 coordinates and offsets as used by the _*_ragged_*()
+        # functions
+        if self._ragged is not None:
+            return (self._ragged.coords.astype(np.float64),
+                    self._ragged.offsets)
+        return _convert_exteriors_to_ragged(
+            [poly.exterior for poly in self.polygons])
 
     def on_(self, image):
         """Project all polygons from one image shape to a new one in-place.
@@ -1521,8 +1602,12 @@ class PolygonsOnImage(IAugmentable):
             self.shape = on_shape  # channels may differ
             return self
 
-        for i, item in enumerate(self.items):
-            self.polygons[i] = item.project_(self.shape, on_shape)
+        if self._ragged is not None:
+            self._ragged.coords = project_coords_(self._ragged.coords,
+                                                  self.shape, on_shape)
+        else:
+            for i, item in enumerate(self.items):
+                self.polygons[i] = item.project_(self.shape, on_shape)
         self.shape = on_shape
         return self
 
@@ -1776,10 +1861,28 @@ class PolygonsOnImage(IAugmentable):
             The object and its items may have been modified in-place.
 
         """
+        h, w = self.shape[0:2]
+        coords, offsets = _convert_exteriors_to_ragged(
+            [poly.exterior for poly in self.polygons])
+        is_convex = _compute_ragged_polygons_convexity(coords, offsets)
+
+        # Clip all convex polygons in one batch without shapely. Polygons
+        # with fewer than three points are handled as line strings.
+        # All remaining polygons are clipped individually via shapely.
+        clipped = [None] * len(self.polygons)
+        convex_ids = np.flatnonzero(is_convex)
+        if len(convex_ids) > 0:
+            convex_clipped = _clip_convex_polygons_out_of_image(
+                [self.polygons[i] for i in convex_ids], h, w)
+            for i, polys_clipped in zip(convex_ids, convex_clipped):
+                clipped[i] = polys_clipped
+
         self.polygons = [
             poly_clipped
-            for poly in self.polygons
-            for poly_clipped in poly.clip_out_of_image(self.shape)]
+            for i, poly in enumerate(self.polygons)
+            for poly_clipped in (
+                clipped[i] if clipped[i] is not None
+                else poly.clip_out_of_image(self.shape))]
         return self
 
     def clip_out_of_image(self):
@@ -1807,6 +1910,45 @@ class PolygonsOnImage(IAugmentable):
         """
         return self.copy().clip_out_of_image_()
 
+    def compute_areas(self):
+        """Compute the areas of all polygons in this container.
+
+        The areas are computed in a single vectorized pass, which is
+        faster than accessing :attr:`Polygon.area` of each polygon.
+
+        Added in 0.5.0.
+
+        Returns
+        -------
+        ndarray
+            ``(N,)`` ``float64`` array containing the area of each polygon.
+            Polygons with fewer than three points have an area of ``0``.
+
+        """
+        coords, offsets = self._get_ragged_exteriors()
+        areas = _compute_ragged_polygon_areas(coords, offsets)
+        areas[np.diff(offsets) < 3] = 0.0
+        return areas
+
+    def compute_validity(self):
+        """Estimate for all polygons in this container whether they are valid.
+
+        This is the vectorized equivalent of :attr:`Polygon.is_valid`.
+        Convex polygons are checked without using shapely. All other
+        polygons are checked via shapely.
+
+        Added in 0.5.0.
+
+        Returns
+        -------
+        ndarray
+            ``(N,)`` ``bool`` array denoting for each polygon whether it
+            is valid.
+
+        """
+        coords, offsets = self._get_ragged_exteriors()
+        return _compute_ragged_polygons_validity(coords, offsets)
+
     def shift_(self, x=0, y=0):
         """Move the polygons along the x/y-axis in-place.
 
@@ -1830,6 +1972,10 @@ class PolygonsOnImage(IAugmentable):
             Shifted polygons.
 
         """
+        if self._ragged is not None:
+            self._ragged.coords += np.float32([x, y])
+            return self
+
         for i, poly in enumerate(self.polygons):
             self.polygons[i] = poly.shift_(x=x, y=y)
         return self
@@ -1929,6 +2075,8 @@ class PolygonsOnImage(IAugmentable):
             instance.
 
         """
+        if self._ragged is not None:
+            return np.copy(self._ragged.coords)
         if self.empty:
             return np.zeros((0, 2), dtype=np.float32)
         return np.concatenate([poly.exterior for poly in self.polygons])
@@ -1970,6 +2118,15 @@ class PolygonsOnImage(IAugmentable):
             "Expected input array to have shape (N,2), "
             "got shape %s." % (xy.shape,))
 
+        if self._ragged is not None:
+            assert len(xy) == self._ragged.nb_points, (
+                "Expected to get exactly as many xy-coordinates as there are "
+                "points in the exteriors of all polygons within this "
+                "instance. Got %d points, expected %d points." % (
+                    len(xy), self._ragged.nb_points))
+            self._ragged.coords[...] = xy.reshape((-1, 2))
+            return self
+
         counter = 0
         for poly in self.polygons:
             nb_points = len(poly.exterior)
@@ -2005,10 +2162,8 @@ class PolygonsOnImage(IAugmentable):
         from . import KeypointsOnImage
         if self.empty:
             return KeypointsOnImage([], shape=self.shape)
-        exteriors = np.concatenate(
-            [poly.exterior for poly in self.polygons],
-            axis=0)
-        return KeypointsOnImage.from_xy_array(exteriors, shape=self.shape)
+        return KeypointsOnImage.from_xy_array(self.to_xy_array(),
+                                              shape=self.shape)
 
     def invert_to_keypoints_on_image_(self, kpsoi):
         """Invert the output of ``to_keypoints_on_image()`` in-place.
@@ -2031,6 +2186,15 @@ class PolygonsOnImage(IAugmentable):
             Note that the instance is also updated in-place.
 
         """
+        if self._ragged is not None:
+            assert len(kpsoi.keypoints) == self._ragged.nb_points, (
+                "Expected %d coordinates, got %d." % (
+                    self._ragged.nb_points, len(kpsoi.keypoints)))
+            if len(kpsoi.keypoints) > 0:
+                self._ragged.coords[...] = kpsoi.to_xy_array()
+            self.shape = kpsoi.shape
+            return self
+
         polys = self.polygons
         exteriors = [poly.exterior for poly in polys]
         nb_points_exp = sum([len(exterior) for exterior in exteriors])
@@ -2071,11 +2235,13 @@ class PolygonsOnImage(IAugmentable):
             Shallow copy.
 
         """
-        if polygons is None:
-            polygons = self.polygons[:]
         if shape is None:
             # use tuple() here in case the shape was provided as a list
             shape = tuple(self.shape)
+        if polygons is None and self._ragged is not None:
+            return self._from_ragged(self._ragged.copy(), shape)
+        if polygons is None:
+            polygons = self.polygons[:]
 
         return PolygonsOnImage(polygons, shape)
 
@@ -2103,14 +2269,23 @@ class PolygonsOnImage(IAugmentable):
 
         """
         # Manual copy is far faster than deepcopy, so use manual copy here.
-        if polygons is None:
-            polygons = [poly.deepcopy() for poly in self.polygons]
         if shape is None:
             # use tuple() here in case the shape was provided as a list
             shape = tuple(self.shape)
+        if polygons is None and self._ragged is not None:
+            return self._from_ragged(self._ragged.deepcopy(), shape)
+        if polygons is None:
+            polygons = [poly.deepcopy() for poly in self.polygons]
 
         return PolygonsOnImage(polygons, shape)
 
+    @classmethod
+    def _from_ragged(cls, ragged, shape):
+        psoi = PolygonsOnImage([], shape)
+        psoi._polygons = None
+        psoi._ragged = ragged
+        return psoi
+
     def __getitem__(self, indices):
         """Get the polygon(s) with given indices.
 
@@ -2150,6 +2325,8 @@ class PolygonsOnImage(IAugmentable):
             Number of items in this instance.
 
         """
+        if self._ragged is not None:
+            return len(self._ragged)
         return len(self.items)
 
     def __repr__(self):
@@ -2184,6 +2361,501 @@ def _convert_points_to_shapely_line_string(points, closed=False,
     return shapely.geometry.LineString(points_tuples)
 
 
+# Added in 0.5.0.
+def _convert_exteriors_to_ragged(exteriors):
+    """Concatenate polygon exteriors to one ragged ``(N,2)`` float64 array.
+
+    Returns the concatenated coordinates and an array of ``P+1`` offsets,
+    where the exterior of polygon ``i`` is ``coords[offsets[i]:offsets[i+1]]``.
+
+    """
+    lengths = np.array([len(exterior) for exterior in exteriors],
+                       dtype=np.intp)
+    offsets = np.zeros((len(exteriors)+1,), dtype=np.intp)
+    np.cumsum(lengths, out=offsets[1:])
+    if offsets[-1] == 0:
+        return np.zeros((0, 2), dtype=np.float64), offsets
+    coords = np.concatenate(exteriors, axis=0).astype(np.float64)
+    return coords, offsets
+
+
+# Added in 0.5.0.
+def _get_ragged_neighbour_indices(offsets):
+    """Get the cyclic previous and next point index of each ragged point."""
+    nb_points = offsets[-1]
+    lengths = np.diff(offsets)
+    idx = np.arange(nb_points)
+    starts = np.repeat(offsets[:-1], lengths)
+    ends = np.repeat(offsets[1:], lengths)
+    idx_next = idx + 1
+    idx_next[idx_next == ends] = starts[idx_next == ends]
+    idx_prev = idx - 1
+    idx_prev[idx < starts + 1] = ends[idx < starts + 1] - 1
+    return idx_prev, idx_next
+
+
+# Added in 0.5.0.
+def _sum_ragged(values, offsets):
+    """Sum the values of each ragged segment (empty segments sum to 0)."""
+    cumsums = np.zeros((len(values)+1,), dtype=np.float64)
+    np.cumsum(values, out=cumsums[1:])
+    return cumsums[offsets[1:]] - cumsums[offsets[:-1]]
+
+
+# Added in 0.5.0.
+def _compute_ragged_polygon_areas(coords, offsets, signed=False):
+    """Compute the (shoelace) area of each polygon in a ragged array.
+
+    Signed areas are positive for counter-clockwise polygons in a
+    coordinate system with upwards pointing y-axis.
+
+    """
+    _, idx_next = _get_ragged_neighbour_indices(offsets)
+    cross = (coords[:, 0] * coords[idx_next, 1]
+             - coords[idx_next, 0] * coords[:, 1])
+    areas = 0.5 * _sum_ragged(cross, offsets)
+    if signed:
+        return areas
+    return np.abs(areas)
+
+
+# Added in 0.5.0.
+def _compute_ragged_polygons_convexity(coords, offsets):
+    """Estimate per polygon in a ragged array whether it is simple and convex.
+
+    A polygon is denoted as convex if it has at least three points, no
+    zero-length edges, turns at every point in the same direction (or goes
+    straight ahead) and winds exactly once around its interior. Such
+    polygons are always valid. Polygons for which this function returns
+    ``False`` may still be valid.
+
+    """
+    lengths = np.diff(offsets)
+    if len(coords) == 0:
+        return np.zeros((len(lengths),), dtype=bool)
+
+    idx_prev, idx_next = _get_ragged_neighbour_indices(offsets)
+    edges_in = coords - coords[idx_prev]
+    edges_out = coords[idx_next] - coords
+    cross = (edges_in[:, 0] * edges_out[:, 1]
+             - edges_in[:, 1] * edges_out[:, 0])
+    dot = np.sum(edges_in * edges_out, axis=1)
+
+    zero_length = np.all(edges_out == 0, axis=1)
+    spike = (cross == 0) & (dot <= 0)
+    nb_invalid = _sum_ragged(zero_length | spike, offsets)
+    nb_positive = _sum_ragged(cross > 0, offsets)
+    nb_negative = _sum_ragged(cross < 0, offsets)
+    # total turning angle must be exactly one full turn, otherwise the
+    # polygon winds multiple times around its center (e.g. pentagrams)
+    turning = np.abs(_sum_ragged(np.arctan2(cross, dot), offsets))
+
+    return (
+        (lengths >= 3)
+        & (nb_invalid == 0)
+        & ((nb_positive == 0) | (nb_negative == 0))
+        & (np.abs(turning - 2 * np.pi) < 1e-6)
+    )
+
+
+# Added in 0.5.0.
+def _compute_ragged_polygons_validity(coords, offsets):
+    """Estimate per polygon in a ragged array whether it is valid.
+
+    Convex polygons are handled without shapely. All other polygons with at
+    least three points are checked via shapely.
+
+    """
+    lengths = np.diff(offsets)
+    is_valid = _compute_ragged_polygons_convexity(coords, offsets)
+    to_check = np.flatnonzero(~is_valid & (lengths >= 3))
+    if len(to_check) == 0:
+        return is_valid
+
+    for i in to_check:
+        polygon = Polygon(coords[offsets[i]:offsets[i+1]])
+        is_valid[i] = polygon.to_shapely_polygon().is_valid
+    return is_valid
+
+
+# Added in 0.5.0.
+def _is_polygon_convex(exterior):
+    """Estimate whether a single polygon is simple and convex.
+
+    This is the single-polygon equivalent of
+    :func:`_compute_ragged_polygons_convexity` with less overhead.
+
+    """
+    if len(exterior) < 3:
+        return False
+
+    points = np.asarray(exterior, dtype=np.float64)
+    edges_out = np.empty_like(points)
+    edges_out[:-1] = points[1:] - points[:-1]
+    edges_out[-1] = points[0] - points[-1]
+    edges_in = np.empty_like(points)
+    edges_in[1:] = edges_out[:-1]
+    edges_in[0] = edges_out[-1]
+    cross = (edges_in[:, 0] * edges_out[:, 1]
+             - edges_in[:, 1] * edges_out[:, 0])
+    if cross.max() > 0 and cross.min() < 0:
+        return False
+
+    dot = edges_in[:, 0] * edges_out[:, 0] + edges_in[:, 1] * edges_out[:, 1]
+    if np.any((cross == 0) & (dot <= 0)):
+        # spikes or zero-length edges
+        return False
+
+    turning = abs(np.sum(np.arctan2(cross, dot)))
+    return abs(turning - 2 * np.pi) < 1e-6
+
+
+# Added in 0.5.0.
+def _is_exterior_valid(exterior):
+    """Estimate whether a polygon exterior is valid.
+
+    Equivalent to :attr:`Polygon.is_valid`, but without creating a
+    :class:`Polygon` instance.
+
+    """
+    # load shapely lazily, which makes the dependency more optional
+    import shapely.geometry
+
+    if len(exterior) < 3:
+        return False
+    if _is_polygon_convex(exterior):
+        return True
+    return shapely.geometry.Polygon(exterior).is_valid
+
+
+# Added in 0.5.0.
+def _clip_ragged_polygons_by_line(coords, offsets, axis, value, keep_above):
+    """Apply one Sutherland-Hodgman step to all polygons of a ragged array.
+
+    Keeps the parts of all polygons on one side of the line ``axis=value``.
+    The result is correct for convex polygons.
+
+    """
+    if len(coords) == 0:
+        return coords, offsets
+
+    idx_prev, _ = _get_ragged_neighbour_indices(offsets)
+    if keep_above:
+        inside = coords[:, axis] >= value
+    else:
+        inside = coords[:, axis] <= value
+    crossing = inside != inside[idx_prev]
+
+    # each point emits the intersection of its incoming edge with the
+    # line (if the edge crosses the line), followed by itself (if inside)
+    nb_emitted = crossing.astype(np.intp) + inside
+    cumsums = np.zeros((len(coords)+1,), dtype=np.intp)
+    np.cumsum(nb_emitted, out=cumsums[1:])
+
+    coords_new = np.empty((cumsums[-1], 2), dtype=np.float64)
+    coords_new[cumsums[:-1][inside] + crossing[inside]] = coords[inside]
+
+    if np.any(crossing):
+        start = coords[idx_prev[crossing]]
+        end = coords[crossing]
+        factor = (value - start[:, axis]) / (end[:, axis] - start[:, axis])
+        intersections = start + factor[:, np.newaxis] * (end - start)
+        intersections[:, axis] = value
+        coords_new[cumsums[:-1][crossing]] = intersections
+
+    return coords_new, cumsums[offsets]
+
+
+# Added in 0.5.0.
+def _clip_ragged_convex_polygons_to_image_plane(coords, offsets, height,
+                                                width):
+    """Clip all convex polygons in a ragged array to an image plane."""
+    for axis, value, keep_above in [(0, 0, True), (0, width, False),
+                                    (1, 0, True), (1, height, False)]:
+        coords, offsets = _clip_ragged_polygons_by_line(
+            coords, offsets, axis, value, keep_above)
+    return coords, offsets
+
+
+# Added in 0.5.0.
+def _clip_convex_polygons_out_of_image(polygons, height, width):
+    """Clip convex polygons to an image plane without using shapely.
+
+    The results match :func:`Polygon.clip_out_of_image`, i.e. each clipped
+    polygon is returned as a list of zero or one polygons, oriented like
+    shapely orients clipping results and reordered so that its first point
+    is the one closest to a point of the input polygon.
+
+    """
+    coords, offsets = _convert_exteriors_to_ragged(
+        [polygon.exterior for polygon in polygons])
+    coords, offsets = _clip_ragged_convex_polygons_to_image_plane(
+        coords, offsets, height, width)
+
+    # remove consecutive duplicate points, which are introduced if a
+    # point is on the image plane's edge
+    _, idx_next = _get_ragged_neighbour_indices(offsets)
+    is_unique = np.any(coords != coords[idx_next], axis=1)
+    nb_unique = _sum_ragged(is_unique, offsets).astype(np.intp)
+    coords = coords[is_unique]
+    offsets = np.zeros_like(offsets)
+    np.cumsum(nb_unique, out=offsets[1:])
+
+    areas = _compute_ragged_polygon_areas(coords, offsets, signed=True)
+
+    result = []
+    for i, polygon in enumerate(polygons):
+        exterior = coords[offsets[i]:offsets[i+1]]
+        if len(exterior) < 3 or areas[i] == 0:
+            # polygons that become lines/points after clipping are ignored
+            result.append([])
+            continue
+        if areas[i] > 0:
+            # shapely returns clockwise shells
+            exterior = exterior[::-1]
+        # explicitly close the exterior (as shapely does) so that the
+        # Polygon's removal of duplicated end points behaves the same
+        exterior = np.concatenate([exterior, exterior[0:1]], axis=0)
+        polygon_clipped = Polygon(exterior, label=polygon.label)
+        result.append([_reorder_clipped_polygon(polygon_clipped, polygon)])
+    return result
+
+
+# Added in 0.5.0.
+def _reorder_clipped_polygon(polygon_clipped, polygon_orig):
+    """Make the point closest to any point of the original polygon first.
+
+    Ties are resolved in favor of earlier points of the original polygon
+    and then earlier points of the clipped polygon.
+
+    """
+    if len(polygon_orig.exterior) == 0 or len(polygon_clipped.exterior) == 0:
+        return polygon_clipped
+    diffs = (polygon_clipped.exterior[np.newaxis, :, :]
+             - polygon_orig.exterior[:, np.newaxis, :])
+    distances = np.sqrt(diffs[:, :, 0] ** 2 + diffs[:, :, 1] ** 2)
+    _, best_idx = np.unravel_index(np.argmin(distances), distances.shape)
+    return polygon_clipped.change_first_point_by_index(best_idx)
+
+
+# Added in 0.5.0.
+def _convert_shapely_clip_result_to_polygons(geometry, polygon_orig, height,
+                                             width):
+    """Convert the shapely intersection of a polygon and an image plane."""
+    # load shapely lazily, which makes the dependency more optional
+    import shapely.geometry
+
+    ignore_types = (shapely.geometry.LineString,
+                    shapely.geometry.MultiLineString,
+                    shapely.geometry.point.Point,
+                    shapely.geometry.MultiPoint)
+    if isinstance(geometry, shapely.geometry.Polygon):
+        geometry = shapely.geometry.MultiPolygon([geometry])
+    elif isinstance(geometry, shapely.geometry.MultiPolygon):
+        # we got a multipolygon from shapely, no need to change anything
+        # anymore
+        pass
+    elif isinstance(geometry, ignore_types):
+        # polygons that become (one or more) lines/points after clipping
+        # are here ignored
+        geometry = shapely.geometry.MultiPolygon([])
+    elif isinstance(geometry, shapely.geometry.GeometryCollection):
+        # Shapely returns GEOMETRYCOLLECTION EMPTY if there is nothing
+        # remaining after the clip.
+        assert geometry.is_empty
+        return []
+    else:
+        raise Exception(
+            "Got an unexpected result of type %s from Shapely for "
+            "image (%d, %d) and polygon %s. This is an internal error. "
+            "Please report." % (
+                type(geometry), height, width, polygon_orig.exterior)
+        )
+
+    # Shapely changes the order of points, we try here to preserve it as
+    # much as possible.
+    # Note here, that all points of the new polygon might have high
+    # distance to the points on the old polygon. This can happen if the
+    # polygon overlaps with the image plane, but all of its points are
+    # outside of the image plane. The new polygon will not be made up of
+    # any of the old points.
+    polygons = []
+    for poly_inter_shapely in geometry.geoms:
+        polygon = Polygon.from_shapely(poly_inter_shapely,
+                                       label=polygon_orig.label)
+        if len(polygon.exterior) > 0:
+            polygons.append(_reorder_clipped_polygon(polygon, polygon_orig))
+    return polygons
+
+
+# Added in 0.5.0.
+def _find_segment_intersections(starts, ends, eps=1e-4,
+                                chunk_size=2**16):
+    """Find all intersection points between line segments.
+
+    Candidate pairs of segments are generated by a sweep over the segments
+    sorted by their minimum x-coordinate, keeping only pairs with
+    overlapping bounding boxes. The candidates are then tested in chunks
+    of vectorized computations. Points at which the involved segments only
+    touch with their endpoints (e.g. consecutive segments of a polygon)
+    are not counted as intersections. Parallel segments are never counted
+    as intersecting.
+
+    Parameters
+    ----------
+    starts : ndarray
+        ``(N,2)`` array of segment start points.
+
+    ends : ndarray
+        ``(N,2)`` array of segment end points.
+
+    eps : float, optional
+        Tolerance (in coordinate units) to use when testing whether
+        an intersection point is on a segment or at one of its endpoints.
+
+    chunk_size : int, optional
+        Maximum number of candidate pairs of segments to test at once.
+        Limits the memory consumption.
+
+    Returns
+    -------
+    list of tuple
+        List of ``((x, y), segment_ids)`` tuples, one per intersection
+        point. ``segment_ids`` is an ascending list of the indices of all
+        segments that contain the point.
+
+    """
+    nb_segments = len(starts)
+    if nb_segments < 2:
+        return []
+
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    directions = ends - starts
+    lengths = np.sqrt(np.sum(directions ** 2, axis=1))
+    mins = np.minimum(starts, ends) - eps
+    maxs = np.maximum(starts, ends) + eps
+
+    # Sweep over x: for segment i (in order of ascending min x), all
+    # segments with a bounding box overlapping in x directly follow i and
+    # start before max x of segment i.
+    order = np.argsort(mins[:, 0], kind="stable")
+    mins_x_sorted = mins[order, 0]
+    ends_sweep = np.searchsorted(mins_x_sorted, maxs[order, 0],
+                                 side="right")
+    counts = ends_sweep - np.arange(1, nb_segments+1)
+    counts_cumsum = np.cumsum(counts)
+
+    ids_a_all = []
+    ids_b_all = []
+    points_all = []
+    chunk_start = 0
+    while chunk_start < nb_segments:
+        offset = counts_cumsum[chunk_start] - counts[chunk_start]
+        chunk_end = np.searchsorted(counts_cumsum, offset + chunk_size,
+                                    side="right")
+        chunk_end = min(max(chunk_end, chunk_start + 1), nb_segments)
+
+        counts_chunk = counts[chunk_start:chunk_end]
+        sweep_ids_a = np.repeat(np.arange(chunk_start, chunk_end),
+                                counts_chunk)
+        pair_starts = np.cumsum(counts_chunk) - counts_chunk
+        sweep_ids_b = (
+            sweep_ids_a + 1
+            + np.arange(len(sweep_ids_a))
+            - np.repeat(pair_starts, counts_chunk))
+        chunk_start = chunk_end
+
+        ids_a = order[sweep_ids_a]
+        ids_b = order[sweep_ids_b]
+        ids_a, ids_b = np.minimum(ids_a, ids_b), np.maximum(ids_a, ids_b)
+        valid = (
+            (mins[ids_a, 1] <= maxs[ids_b, 1])
+            & (mins[ids_b, 1] <= maxs[ids_a, 1])
+            & (lengths[ids_a] > 0)
+            & (lengths[ids_b] > 0))
+        if not np.any(valid):
+            continue
+
+        ids_a, ids_b, points = _intersect_segment_pairs(
+            starts, directions, lengths, ids_a[valid], ids_b[valid], eps)
+        ids_a_all.append(ids_a)
+        ids_b_all.append(ids_b)
+        points_all.append(points)
+
+    if len(points_all) == 0:
+        return []
+    ids_a = np.concatenate(ids_a_all)
+    ids_b = np.concatenate(ids_b_all)
+    points = np.concatenate(points_all)
+    if len(points) == 0:
+        return []
+
+    # sort pairs by segment indices, so that the result does not depend on
+    # the order of the sweep
+    pair_order = np.lexsort((ids_b, ids_a))
+    ids_a = ids_a[pair_order]
+    ids_b = ids_b[pair_order]
+    points = points[pair_order]
+
+    # merge points found for several pairs of segments, e.g. if three
+    # segments cross at the same location
+    decimals = max(int(np.ceil(-np.log10(eps))), 0)
+    _, first_ids, group_ids = np.unique(
+        np.round(points, decimals), axis=0, return_index=True,
+        return_inverse=True)
+    segment_ids_by_group = [set() for _ in first_ids]
+    for group_idx, idx_a, idx_b in zip(group_ids.flatten().tolist(),
+                                       ids_a.tolist(), ids_b.tolist()):
+        segment_ids_by_group[group_idx].update((idx_a, idx_b))
+
+    return [
+        ((float(points[first_idx, 0]), float(points[first_idx, 1])),
+         sorted(segment_ids))
+        for first_idx, segment_ids
+        in zip(first_ids, segment_ids_by_group)]
+
+
+def _intersect_segment_pairs(starts, directions, lengths, ids_a, ids_b, eps):
+    """Compute intersection points of pairs of non-degenerate segments.
+
+    Returns the pairs that intersect (excluding endpoint-only contacts)
+    and their intersection points.
+
+    """
+    dir_a = directions[ids_a]
+    dir_b = directions[ids_b]
+    diff = starts[ids_b] - starts[ids_a]
+    denom = dir_a[:, 0] * dir_b[:, 1] - dir_a[:, 1] * dir_b[:, 0]
+    nonparallel = (
+        np.abs(denom) > 1e-12 * lengths[ids_a] * lengths[ids_b])
+    ids_a = ids_a[nonparallel]
+    ids_b = ids_b[nonparallel]
+    dir_a = dir_a[nonparallel]
+    dir_b = dir_b[nonparallel]
+    diff = diff[nonparallel]
+    denom = denom[nonparallel]
+
+    # positions of the intersection point along both segments, measured
+    # in coordinate units from their start points
+    len_a = lengths[ids_a]
+    len_b = lengths[ids_b]
+    pos_a = (diff[:, 0] * dir_b[:, 1] - diff[:, 1] * dir_b[:, 0]) / denom
+    pos_b = (diff[:, 0] * dir_a[:, 1] - diff[:, 1] * dir_a[:, 0]) / denom
+    pos_a *= len_a
+    pos_b *= len_b
+
+    on_a = (pos_a >= -eps) & (pos_a <= len_a + eps)
+    on_b = (pos_b >= -eps) & (pos_b <= len_b + eps)
+    at_end_a = (pos_a <= eps) | (pos_a >= len_a - eps)
+    at_end_b = (pos_b <= eps) | (pos_b >= len_b - eps)
+    mask = on_a & on_b & ~(at_end_a & at_end_b)
+
+    points = (starts[ids_a[mask]]
+              + (pos_a[mask] / len_a[mask])[:, np.newaxis] * dir_a[mask])
+    return ids_a[mask], ids_b[mask], points
+
+
 class _ConcavePolygonRecoverer(object):
     def __init__(self, threshold_duplicate_points=1e-4, noise_strength=1e-4,
                  oversampling=0.01, max_segment_difference=1e-4):
@@ -2221,14 +2893,12 @@ class _ConcavePolygonRecoverer(object):
 
         # If abs(x) or abs(y) of any coordinate of a polygon is beyond this
         # value, no intersection points will be computed anymore. That is done,
-        # because the underlying library to find these points uses float
-        # values as keys and may therefore start to encounter inaccuracies
-        # leading to exceptions within that library.
+        # because the fixed tolerance used to find these points becomes
+        # meaningless at such float magnitudes.
         self.limit_coords_values_for_inter_search = 50000
 
-        # Rounding of coordinates to use before feeding them into the
-        # library to search for intersection points. Note that the library
-        # was set to also use a corresponding eps of 1e-4.
+        # Rounding of coordinates to use before searching for intersection
+        # points. The search uses a corresponding eps of 1e-4.
         self.decimals = 4
 
     def recover_from(self, new_exterior, old_polygon, random_state=0):
@@ -2411,7 +3081,6 @@ class _ConcavePolygonRecoverer(object):
     def _generate_intersection_points(self, exterior,
                                       one_point_per_intersection=True,
                                       decimals=4):
-        # pylint: disable=broad-except
         largest_value = np.max(np.abs(np.array(exterior, dtype=np.float32)))
         too_large_values = (
             largest_value > self.limit_coords_values_for_inter_search)
@@ -2440,77 +3109,24 @@ class _ConcavePolygonRecoverer(object):
         if len(exterior) <= 0:
             return []
 
-        # use (*[i][0], *[i][1]) formulation here instead of just *[i],
-        # because this way we convert numpy arrays to tuples of floats, which
-        # is required by isect_segments_include_segments
-        segments = [
-            (
-                (
-                    np.round(float(exterior[i][0]), decimals),
-                    np.round(float(exterior[i][1]), decimals)
-                ),
-                (
-                    np.round(float(exterior[(i + 1) % len(exterior)][0]),
-                             decimals),
-                    np.round(float(exterior[(i + 1) % len(exterior)][1]),
-                             decimals)
-                )
-            )
-            for i in range(len(exterior))
-        ]
-
-        # returns [(point, [(segment_p0, segment_p1), ..]), ...]
-        from imgaug.external.poly_point_isect_py2py3 import (
-            isect_segments_include_segments)
-
-        try:
-            intersections = isect_segments_include_segments(segments)
-        except Exception as exc:
-            # Exceptions in the segment intersection search can at least
-            # happen due to large float coords (the library uses
-            # floats as indices, which is bound to cause inaccuracies).
-            # Usually such exceptions should not appear, as too large
-            # coordinate values are already caught at the start of this
-            # function. For the case that there are more errors, this block
-            # will prevent a full crash.
-            ia.warn(
-                "Encountered exception %s during polygon repair in segment "
-                "intersection computation. Will skip that step." % (
-                    str(exc),))
-            traceback.print_exc()
-            return [[] for _ in range(len(exterior))]
+        points = np.round(np.array(exterior, dtype=np.float64), decimals)
+        starts = points
+        ends = np.roll(points, -1, axis=0)
+        intersections = _find_segment_intersections(
+            starts, ends, eps=10**(-decimals))
 
-        # estimate to which segment the found intersection points belong
-        segments_add_points = [[] for _ in range(len(segments))]
-        for point, associated_segments in intersections:
+        # assign the found intersection points to their segments
+        segments_add_points = [[] for _ in range(len(exterior))]
+        for point, segment_ids in intersections:
             # the intersection point may be associated with multiple segments,
             # but we only want to add it once, so pick the first segment
             if one_point_per_intersection:
-                associated_segments = [associated_segments[0]]
-
-            for seg_inter_p0, seg_inter_p1 in associated_segments:
-                diffs = []
-                dists = []
-                for seg_p0, seg_p1 in segments:
-                    dist_p0p0 = np.linalg.norm(seg_p0 - np.array(seg_inter_p0))
-                    dist_p1p1 = np.linalg.norm(seg_p1 - np.array(seg_inter_p1))
-                    dist_p0p1 = np.linalg.norm(seg_p0 - np.array(seg_inter_p1))
-                    dist_p1p0 = np.linalg.norm(seg_p1 - np.array(seg_inter_p0))
-                    diff = min(dist_p0p0 + dist_p1p1, dist_p0p1 + dist_p1p0)
-                    diffs.append(diff)
-                    dists.append(np.linalg.norm(
-                        (seg_p0[0] - point[0], seg_p0[1] - point[1])
-                    ))
-
-                min_diff = np.min(diffs)
-                if min_diff < self.max_segment_difference:
-                    idx = int(np.argmin(diffs))
-                    segments_add_points[idx].append((point, dists[idx]))
-                else:
-                    ia.warn(
-                        "Couldn't find fitting segment in "
-                        "_generate_intersection_points(). Ignoring "
-                        "intersection point.")
+                segment_ids = segment_ids[0:1]
+
+            for idx in segment_ids:
+                dist = np.sqrt((starts[idx, 0] - point[0])**2
+                               + (starts[idx, 1] - point[1])**2)
+                segments_add_points[idx].append((point, dist))
 
         # sort intersection points by their distance to point 0 in each segment
         # (clockwise ordering, this does something only for segments with
@@ -2608,8 +3224,10 @@ class _ConcavePolygonRecoverer(object):
                     + (point[1] - line_start[1])**2)
             return num / den
 
-        poly = Polygon(points)
-        if poly.is_valid:
+        # validity checks are done on index-selected coordinate arrays,
+        # which is faster than creating Polygon instances
+        points_arr = np.float32(points)
+        if _is_exterior_valid(points_arr):
             return sm.xrange(len(points))
 
         hull = scipy.spatial.ConvexHull(points)
@@ -2722,19 +3340,13 @@ class _ConcavePolygonRecoverer(object):
                 point_left_idx = candidates[candidate_idx][0]
                 point_kept_idx = candidates[candidate_idx][1]
                 if (point_left_idx, point_kept_idx) not in done:
-                    in_points_kept_idx = [
-                        i
-                        for i, point_idx
-                        in enumerate(points_kept)
-                        if point_idx == point_kept_idx
-                    ][0]
+                    in_points_kept_idx = points_kept.index(point_kept_idx)
                     points_kept_hypothesis = points_kept[:]
                     points_kept_hypothesis.insert(
                         in_points_kept_idx+1,
                         point_left_idx)
-                    poly_hypothesis = Polygon([
-                        points[idx] for idx in points_kept_hypothesis])
-                    if poly_hypothesis.is_valid:
+                    if _is_exterior_valid(
+                            points_arr[points_kept_hypothesis]):
                         is_valid = True
                         points_kept = points_kept_hypothesis
                         points_left = [point_idx
@@ -322,6 +322,118 @@ def interpolate_points_by_max_distance(points, max_distance, closed=True):
     return points_interp
 
 
+# Added in 0.5.0.
+class _RaggedCoordinates(object):
+    """Coordinates of several polygons or line strings in a single array.
+
+    All ``P`` points of ``N`` items are stored in one ``(P,2)`` ``float32``
+    array. The points of item ``i`` are
+    ``coords[offsets[i]:offsets[i+1]]``.
+
+    Added in 0.5.0.
+
+    Parameters
+    ----------
+    coords : (P,2) ndarray
+        Coordinates of all points of all items.
+
+    offsets : (N+1,) ndarray
+        Start index of each item's points in `coords`, followed by ``P``.
+
+    labels : None or list of None or str
+        Label of each item.
+
+    """
+
+    def __init__(self, coords, offsets, labels=None):
+        coords = np.asarray(coords, dtype=np.float32)
+        if coords.size == 0:
+            coords = coords.reshape((0, 2))
+        offsets = np.asarray(offsets, dtype=np.intp)
+        nb_items = len(offsets) - 1
+
+        assert coords.ndim == 2 and coords.shape[-1] == 2, (
+            "Expected coordinates to have shape (P,2), got shape %s." % (
+                coords.shape,))
+        assert offsets.ndim == 1 and nb_items >= 0, (
+            "Expected offsets to have shape (N+1,), got shape %s." % (
+                offsets.shape,))
+        assert (
+            offsets[0] == 0
+            and offsets[-1] == len(coords)
+            and np.all(np.diff(offsets) >= 0)), (
+                "Expected offsets to be monotonically increasing, starting "
+                "at 0 and ending at the number of points (%d). "
+                "Got %s." % (len(coords), offsets))
+        assert labels is None or len(labels) == nb_items, (
+            "Expected one label per item, got %d labels for %d "
+            "items." % (len(labels), nb_items))
+
+        self.coords = coords
+        self.offsets = offsets
+        self.labels = (list(labels) if labels is not None
+                       else [None] * nb_items)
+
+    @classmethod
+    def from_arrays(cls, arrays, labels=None):
+        """Concatenate ``(M_i,2)`` arrays to ragged coordinates."""
+        lengths = [len(arr) for arr in arrays]
+        offsets = np.zeros((len(arrays)+1,), dtype=np.intp)
+        np.cumsum(lengths, out=offsets[1:])
+        if len(arrays) == 0:
+            coords = np.zeros((0, 2), dtype=np.float32)
+        else:
+            coords = np.concatenate(arrays, axis=0).astype(np.float32)
+        return cls(coords, offsets, labels)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def nb_points(self):
+        """Get the number of points of all items."""
+        return len(self.coords)
+
+    def get_item_coords(self, idx):
+        """Get a view of the coordinates of the item with index `idx`."""
+        return self.coords[self.offsets[idx]:self.offsets[idx+1]]
+
+    def remove_closing_points_(self):
+        """Remove each item's last point if it matches its first point.
+
+        This matches the handling of closing points in ``Polygon``.
+
+        """
+        lengths = np.diff(self.offsets)
+        ids = np.flatnonzero(lengths >= 2)
+        if len(ids) == 0:
+            return self
+        firsts = self.coords[self.offsets[ids]]
+        lasts = self.coords[self.offsets[ids+1] - 1]
+        is_closed = np.all(np.isclose(firsts, lasts), axis=1)
+        if not np.any(is_closed):
+            return self
+
+        mask = np.ones((len(self.coords),), dtype=bool)
+        mask[self.offsets[ids[is_closed]+1] - 1] = False
+        removed = np.zeros((len(lengths),), dtype=np.intp)
+        removed[ids[is_closed]] = 1
+        self.coords = self.coords[mask]
+        self.offsets = self.offsets - np.concatenate(
+            [[0], np.cumsum(removed)])
+        return self
+
+    def copy(self):
+        """Create a shallow copy sharing the coordinate array."""
+        return _RaggedCoordinates(self.coords, self.offsets, self.labels)
+
+    def deepcopy(self):
+        """Create a deep copy."""
+        return _RaggedCoordinates(np.copy(self.coords),
+                                  np.copy(self.offsets),
+                                  list(self.labels))
+
+
 def convert_cbaois_to_kpsois(cbaois):
     """Convert coordinate-based augmentables to KeypointsOnImage instances.
 
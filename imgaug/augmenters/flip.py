@@ -909,21 +909,14 @@ class Fliplr(meta.Augmenter):
                         bb.x1 = width - x2
                         bb.x2 = width - x1
 
-                if batch.polygons is not None:
-                    psoi = batch.polygons[i]
-                    width = psoi.shape[1]
-                    for poly in psoi.polygons:
-                        # TODO maybe reverse the order of points afterwards?
-                        #      the flip probably inverts them
-                        poly.exterior[:, 0] = width - poly.exterior[:, 0]
-
-                if batch.line_strings is not None:
-                    lsoi = batch.line_strings[i]
-                    width = lsoi.shape[1]
-                    for ls in lsoi.line_strings:
-                        # TODO maybe reverse the order of points afterwards?
-                        #      the flip probably inverts them
-                        ls.coords[:, 0] = width - ls.coords[:, 0]
+                # TODO maybe reverse the order of points of polygons and
+                #      line strings afterwards? the flip probably inverts them
+                for cbaois in [batch.polygons, batch.line_strings]:
+                    if cbaois is not None:
+                        cbaoi = cbaois[i]
+                        xy = cbaoi.to_xy_array()
+                        xy[:, 0] = cbaoi.shape[1] - xy[:, 0]
+                        cbaoi.fill_from_xy_array_(xy)
 
         return batch
 
@@ -1023,21 +1016,14 @@ class Flipud(meta.Augmenter):
                         bb.y1 = height - y2
                         bb.y2 = height - y1
 
-                if batch.polygons is not None:
-                    psoi = batch.polygons[i]
-                    height = psoi.shape[0]
-                    for poly in psoi.polygons:
-                        # TODO maybe reverse the order of points afterwards?
-                        #      the flip probably inverts them
-                        poly.exterior[:, 1] = height - poly.exterior[:, 1]
-
-                if batch.line_strings is not None:
-                    lsoi = batch.line_strings[i]
-                    height = lsoi.shape[0]
-                    for ls in lsoi.line_strings:
-                        # TODO maybe reverse the order of points afterwards?
-                        #      the flip probably inverts them
-                        ls.coords[:, 1] = height - ls.coords[:, 1]
+                # TODO maybe reverse the order of points of polygons and
+                #      line strings afterwards? the flip probably inverts them
+                for cbaois in [batch.polygons, batch.line_strings]:
+                    if cbaois is not None:
+                        cbaoi = cbaois[i]
+                        xy = cbaoi.to_xy_array()
+                        xy[:, 1] = cbaoi.shape[0] - xy[:, 1]
+                        cbaoi.fill_from_xy_array_(xy)
 
         return batch
 
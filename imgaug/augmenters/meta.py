@@ -281,6 +281,13 @@ class Augmenter(object):
 
     """
 
+    # Whether this augmenter supports images with deferred colorspace
+    # conversions, see _BatchInAugmentation.images_colorspaces. If ``False``,
+    # all deferred conversions are applied before the augmenter is executed
+    # and after its children were executed.
+    # Added in 0.5.0.
+    _supports_deferred_colorspaces = False
+
     def __init__(self, seed=None, name=None,
                  random_state="deprecated",
                  deterministic="deprecated"):
@@ -603,7 +610,16 @@ class Augmenter(object):
                 "Expected UnnormalizedBatch, Batch or _BatchInAugmentation, "
                 "got %s." % (type(batch).__name__,))
 
-        columns = batch_inaug.columns
+        # Deferred colorspace conversions must be applied before the images
+        # are seen by an augmenter or hook that does not support them.
+        if hooks is not None or not self._supports_deferred_colorspaces:
+            batch_inaug.apply_deferred_colorspaces_()
+
+        # Accessing the columns materializes lazily copied column values of
+        # the batch, hence we only do that if necessary.
+        columns = []
+        if hooks is not None:
+            columns = batch_inaug.columns
 
         # hooks preprocess
         if hooks is not None:
@@ -617,11 +633,12 @@ class Augmenter(object):
 
         # set augmentables to None if this augmenter is deactivated or hooks
         # demands it
+        # For deactivated augmenters, the raw column values are detached
+        # instead, which avoids materializing lazily copied columns.
         set_to_none = []
+        detached = {}
         if not self.activated:
-            for column in columns:
-                set_to_none.append(column)
-                setattr(batch_inaug, column.attr_name, None)
+            detached = batch_inaug._detach_column_values_()
         elif hooks is not None:
             for column in columns:
                 activated = hooks.is_activated(
@@ -649,6 +666,15 @@ class Augmenter(object):
         # revert augmentables being set to None for non-activated augmenters
         for column in set_to_none:
             setattr(batch_inaug, column.attr_name, column.value)
+        batch_inaug._reattach_column_values_(detached)
+
+        # Only keep colorspace conversions deferred if the parent augmenter
+        # can handle them.
+        parent = parents[-1] if parents else None
+        parent_supports_deferred_cspaces = (
+            parent is not None and parent._supports_deferred_colorspaces)
+        if hooks is not None or not parent_supports_deferred_cspaces:
+            batch_inaug.apply_deferred_colorspaces_()
 
         # hooks postprocess
         if hooks is not None:
@@ -2101,6 +2127,69 @@ class Augmenter(object):
         return multicore.Pool(self, processes=processes,
                               maxtasksperchild=maxtasksperchild, seed=seed)
 
+    def stream(self, batches, max_bytes=None, prefetch=None, ordered=True,
+               nb_workers=1, seed=None):
+        """Augment batches from an iterable with bounded memory usage.
+
+        Batches are augmented in background threads of the current process.
+        No new batch is loaded from `batches` while the batches in the
+        pipeline exceed `max_bytes` or `prefetch`.
+        See :class:`~imgaug.multicore.BatchStream` for details.
+
+        Added in 0.5.0.
+
+        Parameters
+        ----------
+        batches : iterable of imgaug.augmentables.batches.Batch or iterable of imgaug.augmentables.batches.UnnormalizedBatch
+            Same as in :func:`~imgaug.multicore.BatchStream.__init__`.
+
+        max_bytes : None or int, optional
+            Same as in :func:`~imgaug.multicore.BatchStream.__init__`.
+
+        prefetch : None or int, optional
+            Same as in :func:`~imgaug.multicore.BatchStream.__init__`.
+
+        ordered : bool, optional
+            Same as in :func:`~imgaug.multicore.BatchStream.__init__`.
+
+        nb_workers : int, optional
+            Same as in :func:`~imgaug.multicore.BatchStream.__init__`.
+
+        seed : None or int, optional
+            Same as in :func:`~imgaug.multicore.BatchStream.__init__`.
+
+        Returns
+        -------
+        imgaug.multicore.BatchStream
+            Stream of augmented batches. Iterate over it to receive the
+            batches. Use it as a context manager to ensure that it is
+            closed.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> import imgaug.augmenters as iaa
+        >>> from imgaug.augmentables.batches import UnnormalizedBatch
+        >>>
+        >>> aug = iaa.Add(1)
+        >>> def generate_batches():
+        >>>     for _ in range(100):
+        >>>         images = np.zeros((16, 128, 128, 3), dtype=np.uint8)
+        >>>         yield UnnormalizedBatch(images=images)
+        >>>
+        >>> with aug.stream(generate_batches(), max_bytes=64*2**20) as stream:
+        >>>     for batch_aug in stream:
+        >>>         pass
+
+        Augment ``100`` batches of ``16`` images each, while keeping at most
+        ``64`` MiB of batches in the pipeline.
+
+        """
+        import imgaug.multicore as multicore
+        return multicore.BatchStream(
+            self, batches, max_bytes=max_bytes, prefetch=prefetch,
+            ordered=ordered, nb_workers=nb_workers, seed=seed)
+
     # TODO most of the code of this function could be replaced with
     #      ia.draw_grid()
     # TODO add parameter for handling multiple images ((a) next to each other
@@ -3101,6 +3190,9 @@ class Sequential(Augmenter, list):
 
     """
 
+    # Added in 0.5.0.
+    _supports_deferred_colorspaces = True
+
     def __init__(self, children=None, random_order=False,
                  seed=None, name=None,
                  random_state="deprecated", deterministic="deprecated"):
@@ -3300,6 +3392,9 @@ class SomeOf(Augmenter, list):
 
     """
 
+    # Added in 0.5.0.
+    _supports_deferred_colorspaces = True
+
     def __init__(self, n=None, children=None, random_order=False,
                  seed=None, name=None,
                  random_state="deprecated", deterministic="deprecated"):
@@ -3612,6 +3707,9 @@ class Sometimes(Augmenter):
 
     """
 
+    # Added in 0.5.0.
+    _supports_deferred_colorspaces = True
+
     def __init__(self, p=0.5, then_list=None, else_list=None,
                  seed=None, name=None,
                  random_state="deprecated", deterministic="deprecated"):
@@ -3993,6 +4091,9 @@ class Identity(Augmenter):
 
     """
 
+    # Added in 0.5.0.
+    _supports_deferred_colorspaces = True
+
     # Added in 0.4.0.
     def __init__(self,
                  seed=None, name=None,
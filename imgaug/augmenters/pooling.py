@@ -98,15 +98,24 @@ class _AbstractPoolingBase(meta.Augmenter):
 
         kernel_sizes_h, kernel_sizes_w = samples
 
+        images_pooled = list(images)
         gen = enumerate(zip(images, kernel_sizes_h, kernel_sizes_w))
         for i, (image, ksize_h, ksize_w) in gen:
             if ksize_h >= 2 or ksize_w >= 2:
-                image_pooled = self._pool_image(
+                images_pooled[i] = self._pool_image(
                     image, ksize_h, ksize_w)
-                if self.keep_size:
-                    image_pooled = ia.imresize_single_image(
-                        image_pooled, image.shape[0:2])
-                images[i] = image_pooled
+
+        if not self.keep_size:
+            return images_pooled
+
+        # resize all pooled images back to their input sizes, grouped by
+        # shape so that each group needs only one resize call
+        shapes_orig = [image.shape[0:2] for image in images]
+        images_rs = ia.imresize_many_images_rowwise(images_pooled,
+                                                    shapes_orig)
+        # images can be an array here, hence the assignment per row
+        for i, image_rs in enumerate(images_rs):
+            images[i] = image_rs
 
         return images
 
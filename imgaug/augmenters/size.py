@@ -91,6 +91,93 @@ def _crop_and_pad_arr(arr, croppings, paddings, pad_mode="constant",
     return image_cr_pa
 
 
+# Crop and pad many images at once into a single preallocated
+# (N,H_out,W_out,[C]) array. Returns None if that is not possible, i.e. if the
+# images differ in dtype or number of channels or if their shapes after
+# cropping and padding differ. croppings and paddings are expected to be
+# (N,4) arrays in TRBL order. Rows that have to be padded with a mode other
+# than "constant" are handled via _crop_and_pad_arr() and then copied into
+# the output array.
+# Added in 0.5.0.
+def _crop_and_pad_arrs_to_fixed_size(images, croppings, paddings, pad_modes,
+                                     pad_cvals):
+    nb_images = len(images)
+    if nb_images == 0:
+        return None
+
+    dtype = images[0].dtype
+    shape_channels = images[0].shape[2:]
+    if not ia.is_np_array(images):
+        all_same = all([
+            image.dtype == dtype and image.shape[2:] == shape_channels
+            for image in images])
+        if not all_same:
+            return None
+
+    croppings = np.array(croppings, dtype=np.int32).reshape((nb_images, 4))
+    paddings = np.array(paddings, dtype=np.int32).reshape((nb_images, 4))
+
+    heights = np.array([image.shape[0] for image in images], dtype=np.int32)
+    widths = np.array([image.shape[1] for image in images], dtype=np.int32)
+    crop_top, crop_bottom = _prevent_zero_sizes_after_crops_(
+        heights, croppings[:, 0], croppings[:, 2])
+    crop_left, crop_right = _prevent_zero_sizes_after_crops_(
+        widths, croppings[:, 3], croppings[:, 1])
+
+    y1s = crop_top
+    y2s = np.maximum(heights - crop_bottom, y1s)
+    x1s = crop_left
+    x2s = np.maximum(widths - crop_right, x1s)
+
+    heights_out = (y2s - y1s) + paddings[:, 0] + paddings[:, 2]
+    widths_out = (x2s - x1s) + paddings[:, 1] + paddings[:, 3]
+    if np.any(heights_out != heights_out[0]):
+        return None
+    if np.any(widths_out != widths_out[0]):
+        return None
+
+    result = np.empty(
+        (nb_images, int(heights_out[0]), int(widths_out[0])) + shape_channels,
+        dtype=dtype)
+
+    is_padded = np.any(paddings > 0, axis=1)
+    is_constant = np.array(
+        [pad_mode in ["constant", cv2.BORDER_CONSTANT]
+         for pad_mode in pad_modes],
+        dtype=bool)
+
+    # Fill the constant pads of all rows with one vectorized assignment. This
+    # also writes to the areas that will afterwards be overwritten by the
+    # image contents, but is still faster than filling each side of each row.
+    mask_fill = is_padded & is_constant
+    if np.any(mask_fill):
+        min_value, _, max_value = iadt.get_value_range_of_dtype(dtype)
+        cvals = np.clip(np.array(pad_cvals)[mask_fill], min_value, max_value)
+        cvals = cvals.astype(dtype).reshape(
+            (-1,) + (1,) * (result.ndim - 1))
+        if np.all(mask_fill):
+            result[...] = cvals
+        else:
+            result[mask_fill] = cvals
+
+    for i, image in enumerate(images):
+        if is_padded[i] and not is_constant[i]:
+            result[i] = _crop_and_pad_arr(
+                image, tuple(croppings[i]), tuple(paddings[i]),
+                pad_modes[i], pad_cvals[i], keep_size=False)
+        else:
+            pad_top = paddings[i, 0]
+            pad_left = paddings[i, 3]
+            height_cr = y2s[i] - y1s[i]
+            width_cr = x2s[i] - x1s[i]
+            result[i,
+                   pad_top:pad_top+height_cr,
+                   pad_left:pad_left+width_cr,
+                   ...] = image[y1s[i]:y2s[i], x1s[i]:x2s[i], ...]
+
+    return result
+
+
 def _crop_and_pad_heatmap_(heatmap, croppings_img, paddings_img,
                            pad_mode="constant", pad_cval=0.0, keep_size=False):
     return _crop_and_pad_hms_or_segmaps_(heatmap, croppings_img,
@@ -1434,13 +1521,12 @@ class Resize(meta.Augmenter):
             input_dtype = images.dtype
 
         samples_a, samples_b, samples_ip = samples
-        result = []
-        for i, image in enumerate(images):
-            h, w = self._compute_height_width(image.shape, samples_a[i],
-                                              samples_b[i], self.size_order)
-            image_rs = ia.imresize_single_image(image, (h, w),
-                                                interpolation=samples_ip[i])
-            result.append(image_rs)
+        sizes = [
+            self._compute_height_width(image.shape, samples_a[i],
+                                       samples_b[i], self.size_order)
+            for i, image in enumerate(images)
+        ]
+        result = ia.imresize_many_images_rowwise(images, sizes, samples_ip)
 
         if input_was_array:
             all_same_size = (len({image.shape for image in result}) == 1)
@@ -2023,6 +2109,17 @@ class CropAndPad(meta.Augmenter):
 
     # Added in 0.4.0.
     def _augment_images_by_samples(self, images, samples):
+        if not self.keep_size:
+            result = _crop_and_pad_arrs_to_fixed_size(
+                images,
+                np.stack([samples.crop_top, samples.crop_right,
+                          samples.crop_bottom, samples.crop_left], axis=-1),
+                np.stack([samples.pad_top, samples.pad_right,
+                          samples.pad_bottom, samples.pad_left], axis=-1),
+                samples.pad_mode, samples.pad_cval)
+            if result is not None:
+                return result if ia.is_np_array(images) else list(result)
+
         result = []
         for i, image in enumerate(images):
             image_cr_pa = _crop_and_pad_arr(
@@ -2782,25 +2879,35 @@ class PadToFixedSize(meta.Augmenter):
 
     # Added in 0.4.0.
     def _augment_images_by_samples(self, images, samples):
-        result = []
         sizes, pad_xs, pad_ys, pad_modes, pad_cvals = samples
+        paddings = []
         for i, (image, size) in enumerate(zip(images, sizes)):
             width_min, height_min = size
             height_image, width_image = image.shape[:2]
-            paddings = self._calculate_paddings(height_image, width_image,
-                                                height_min, width_min,
-                                                pad_xs[i], pad_ys[i])
-
-            image = _crop_and_pad_arr(
-                image, (0, 0, 0, 0), paddings, pad_modes[i], pad_cvals[i],
-                keep_size=False)
-
-            result.append(image)
+            paddings.append(
+                self._calculate_paddings(height_image, width_image,
+                                         height_min, width_min,
+                                         pad_xs[i], pad_ys[i]))
+
+        # In the common case of all images ending up with the same size
+        # (e.g. all images were smaller than the desired size), we allocate
+        # the output array once and copy the images into it.
+        result = _crop_and_pad_arrs_to_fixed_size(
+            images, np.zeros((len(images), 4), dtype=np.int32), paddings,
+            pad_modes, pad_cvals)
+        if result is not None:
+            return result if ia.is_np_array(images) else list(result)
 
         # TODO result is always a list. Should this be converted to an array
         #      if possible (not guaranteed that all images have same size,
         #      some might have been larger than desired height/width)
-        return result
+        return [
+            _crop_and_pad_arr(
+                image, (0, 0, 0, 0), paddings_i, pad_mode, pad_cval,
+                keep_size=False)
+            for image, paddings_i, pad_mode, pad_cval
+            in zip(images, paddings, pad_modes, pad_cvals)
+        ]
 
     # Added in 0.4.0.
     def _augment_keypoints_by_samples(self, keypoints_on_images, samples):
@@ -3145,21 +3252,28 @@ class CropToFixedSize(meta.Augmenter):
 
     # Added in 0.4.0.
     def _augment_images_by_samples(self, images, samples):
-        result = []
         sizes, offset_xs, offset_ys = samples
+        croppings = []
         for i, (image, size) in enumerate(zip(images, sizes)):
             w, h = size
             height_image, width_image = image.shape[0:2]
-
-            croppings = self._calculate_crop_amounts(
-                height_image, width_image, h, w, offset_ys[i], offset_xs[i])
-
-            image_cropped = _crop_and_pad_arr(image, croppings, (0, 0, 0, 0),
-                                              keep_size=False)
-
-            result.append(image_cropped)
-
-        return result
+            croppings.append(
+                self._calculate_crop_amounts(
+                    height_image, width_image, h, w,
+                    offset_ys[i], offset_xs[i]))
+
+        nb_images = len(images)
+        result = _crop_and_pad_arrs_to_fixed_size(
+            images, croppings, np.zeros((nb_images, 4), dtype=np.int32),
+            ["constant"] * nb_images, [0] * nb_images)
+        if result is not None:
+            return result if ia.is_np_array(images) else list(result)
+
+        return [
+            _crop_and_pad_arr(image, croppings_i, (0, 0, 0, 0),
+                              keep_size=False)
+            for image, croppings_i in zip(images, croppings)
+        ]
 
     # Added in 0.4.0.
     def _augment_keypoints_by_samples(self, kpsois, samples):
@@ -4778,15 +4892,22 @@ class KeepSizeByResize(meta.Augmenter):
                           samples):
         interpolations, _, _ = samples
 
-        gen = zip(images, interpolations, shapes_orig)
-        result = []
-        for image, interpolation, input_shape in gen:
-            if interpolation == KeepSizeByResize.NO_RESIZE:
-                result.append(image)
-            else:
-                result.append(
-                    ia.imresize_single_image(image, input_shape[0:2],
-                                             interpolation))
+        # NO_RESIZE is handled by using each image's current size as its
+        # target size
+        sizes = [
+            (image.shape[0:2]
+             if interpolation == KeepSizeByResize.NO_RESIZE
+             else input_shape[0:2])
+            for image, interpolation, input_shape
+            in zip(images, interpolations, shapes_orig)
+        ]
+        interpolations = [
+            None if interpolation == KeepSizeByResize.NO_RESIZE
+            else interpolation
+            for interpolation in interpolations
+        ]
+        result = ia.imresize_many_images_rowwise(images, sizes,
+                                                 interpolations)
 
         if images_were_array:
             # note here that NO_RESIZE can have led to different shapes
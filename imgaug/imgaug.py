@@ -7,6 +7,7 @@ import sys
 import os
 import types
 import functools
+import threading
 # collections.abc exists since 3.3 and is expected to be used for 3.8+
 try:
     from collections.abc import Iterable
@@ -876,7 +877,8 @@ def draw_text(img, y, x, text, color=(0, 255, 0), size=25):
 
 
 # TODO rename sizes to size?
-def imresize_many_images(images, sizes=None, interpolation=None):
+def imresize_many_images(images, sizes=None, interpolation=None,
+                         nb_threads=1):
     """Resize each image in a list or array to a specified size.
 
     **Supported dtypes**:
@@ -934,10 +936,21 @@ def imresize_many_images(images, sizes=None, interpolation=None):
         increases, ``area`` interpolation will be picked and for size
         decreases, ``linear`` interpolation will be picked.
 
+    nb_threads : int, optional
+        Number of threads to use for the calls to ``cv2.resize()``.
+        ``cv2.resize()`` releases the GIL, hence values above ``1`` can
+        speed up the resizing of large batches. The thread pool is created
+        once per number of threads and then reused until the process ends.
+        Augmenters do not expose this argument, i.e. they always resize
+        in the calling thread.
+
+        Added in 0.5.0.
+
     Returns
     -------
-    (N,H',W',[C]) ndarray
+    (N,H',W',[C]) ndarray or list of (H',W',[C]) ndarray
         Array of the resized images.
+        If the input was a ``list``, the output will also be a ``list``.
 
     Examples
     --------
@@ -991,21 +1004,19 @@ def imresize_many_images(images, sizes=None, interpolation=None):
             "ints or two floats, each >= 0, got types %s with values %s." % (
                 str([type(val) for val in sizes]), str(sizes)))
 
-    # if input is a list, call this function N times for N images
-    # but check beforehand if all images have the same shape, then just
-    # convert to a single array and de-convert afterwards
+    # if input is a list, group the images by shape and dtype and resize
+    # each group as a single array
     if isinstance(images, list):
-        nb_shapes = len({image.shape for image in images})
-        if nb_shapes == 1:
-            return list(imresize_many_images(
-                np.array(images), sizes=sizes, interpolation=interpolation))
-
-        return [
-            imresize_many_images(
-                image[np.newaxis, ...],
-                sizes=sizes,
-                interpolation=interpolation)[0, ...]
-            for image in images]
+        groups = _group_indices_by_key(
+            [(image.shape, image.dtype.name) for image in images])
+        result = [None] * len(images)
+        for indices in groups.values():
+            group_rs = imresize_many_images(
+                _stack_by_indices(images, indices), sizes=sizes,
+                interpolation=interpolation, nb_threads=nb_threads)
+            for idx, image_rs in zip(indices, group_rs):
+                result[idx] = image_rs
+        return result
 
     shape = images.shape
     assert images.ndim in [3, 4], "Expected array of shape (N, H, W, [C]), " \
@@ -1083,54 +1094,164 @@ def imresize_many_images(images, sizes=None, interpolation=None):
             augmenter=None
         )
 
+    # Convert the dtypes once for the whole batch instead of once per image
+    # and let cv2 write directly into a preallocated output array.
+    input_dtype_name = images.dtype.name
+    if input_dtype_name == "bool":
+        images = images.astype(np.uint8) * 255
+    elif input_dtype_name == "int8" and inter != cv2.INTER_NEAREST:
+        images = images.astype(np.int16)
+    elif input_dtype_name == "float16":
+        images = images.astype(np.float32)
+
     result_shape = (nb_images, height_target, width_target)
     if nb_channels is not None:
         result_shape = result_shape + (nb_channels,)
-    result = np.zeros(result_shape, dtype=images.dtype)
-    for i, image in enumerate(images):
-        input_dtype = image.dtype
-        input_dtype_name = input_dtype.name
-
-        if input_dtype_name == "bool":
-            image = image.astype(np.uint8) * 255
-        elif input_dtype_name == "int8" and inter != cv2.INTER_NEAREST:
-            image = image.astype(np.int16)
-        elif input_dtype_name == "float16":
-            image = image.astype(np.float32)
+    result = np.empty(result_shape, dtype=images.dtype)
 
+    def _resize_row(i):
+        image = images[i]
         if nb_channels is not None and nb_channels > 512:
-            channels = [
-                cv2.resize(image[..., c], (width_target, height_target),
-                           interpolation=inter) for c in sm.xrange(nb_channels)]
-            result_img = np.stack(channels, axis=-1)
+            for c in sm.xrange(nb_channels):
+                _resize_into_cv2(image[..., c], result[i, :, :, c], inter)
+        elif nb_channels == 1:
+            # cv2 removes the channel axis if input was (H, W, 1)
+            _resize_into_cv2(image[..., 0], result[i, :, :, 0], inter)
         else:
-            result_img = cv2.resize(
-                image, (width_target, height_target), interpolation=inter)
+            _resize_into_cv2(image, result[i], inter)
 
-        assert result_img.dtype.name == image.dtype.name, (
+    if nb_threads > 1 and nb_images > 1:
+        # list() to wait for all rows and to re-raise exceptions
+        list(_get_thread_pool(nb_threads).map(_resize_row,
+                                              sm.xrange(nb_images)))
+    else:
+        for i in sm.xrange(nb_images):
+            _resize_row(i)
+
+    if input_dtype_name == "bool":
+        result = result > 127
+    elif input_dtype_name == "int8" and inter != cv2.INTER_NEAREST:
+        result = iadt.restore_dtypes_(result, np.int8)
+    elif input_dtype_name == "float16":
+        result = iadt.restore_dtypes_(result, np.float16)
+    return result
+
+
+# Added in 0.5.0.
+def _resize_into_cv2(image, dst, interpolation):
+    height, width = dst.shape[0:2]
+    image_rs = cv2.resize(image, (width, height), dst=dst,
+                          interpolation=interpolation)
+    # cv2 only writes into dst if dst has the expected shape and dtype and
+    # is contiguous, otherwise it allocates a new array
+    if image_rs is not dst:
+        assert image_rs.dtype.name == dst.dtype.name, (
             "Expected cv2.resize() to keep the input dtype '%s', but got "
             "'%s'. This is an internal error. Please report." % (
-                image.dtype.name, result_img.dtype.name
+                dst.dtype.name, image_rs.dtype.name
             )
         )
+        dst[...] = image_rs.reshape(dst.shape)
+
+
+# Thread pools used by imresize_many_images(), one per requested number of
+# threads. They are created on first use and then kept alive for the
+# remainder of the process (idle workers only cost a blocked thread each).
+# ThreadPoolExecutor joins its workers at interpreter exit.
+# Added in 0.5.0.
+_THREAD_POOLS = {}
+_THREAD_POOLS_LOCK = threading.Lock()
+
+
+# Added in 0.5.0.
+def _get_thread_pool(nb_threads):
+    # not available in python 2.7, hence imported here
+    from concurrent.futures import ThreadPoolExecutor
+
+    with _THREAD_POOLS_LOCK:
+        pool = _THREAD_POOLS.get(nb_threads)
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=nb_threads)
+            _THREAD_POOLS[nb_threads] = pool
+    return pool
+
+
+# Added in 0.5.0.
+def _group_indices_by_key(keys):
+    groups = {}
+    for idx, key in enumerate(keys):
+        groups.setdefault(key, []).append(idx)
+    return groups
+
+
+# Added in 0.5.0.
+def _stack_by_indices(arrs, indices):
+    if len(indices) == 1:
+        return arrs[indices[0]][np.newaxis, ...]
+    return np.stack([arrs[idx] for idx in indices], axis=0)
+
+
+def imresize_many_images_rowwise(images, sizes, interpolations=None,
+                                 nb_threads=1):
+    """Resize each image in a list or array to its own target size.
+
+    In contrast to :func:`~imgaug.imgaug.imresize_many_images`, this
+    function accepts one ``(height, width)`` target size and one
+    interpolation per image. The images are grouped by shape, dtype,
+    interpolation and target size and each group is resized with a single
+    call of :func:`~imgaug.imgaug.imresize_many_images`. Images whose target
+    size equals their current size are returned unchanged (i.e. not copied).
+
+    Added in 0.5.0.
+
+    **Supported dtypes**:
+
+        See :func:`~imgaug.imgaug.imresize_many_images`.
+
+    Parameters
+    ----------
+    images : (N,H,W,[C]) ndarray or list of (H,W,[C]) ndarray
+        Images to resize.
+
+    sizes : iterable of tuple of int
+        One ``(height, width)`` tuple per image.
 
-        # cv2 removes the channel axis if input was (H, W, 1)
-        # we re-add it (but only if input was not (H, W))
-        if (len(result_img.shape) == 2 and nb_channels is not None
-                and nb_channels == 1):
-            result_img = result_img[:, :, np.newaxis]
-
-        if input_dtype_name == "bool":
-            result_img = result_img > 127
-        elif input_dtype_name == "int8" and inter != cv2.INTER_NEAREST:
-            # TODO somehow better avoid circular imports here
-            from . import dtypes as iadt
-            result_img = iadt.restore_dtypes_(result_img, np.int8)
-        elif input_dtype_name == "float16":
-            # TODO see above
-            from . import dtypes as iadt
-            result_img = iadt.restore_dtypes_(result_img, np.float16)
-        result[i] = result_img
+    interpolations : None or iterable of (None or str or int), optional
+        One interpolation per image or ``None``.
+        See :func:`~imgaug.imgaug.imresize_many_images`.
+
+    nb_threads : int, optional
+        See :func:`~imgaug.imgaug.imresize_many_images`.
+
+    Returns
+    -------
+    list of ndarray
+        Resized images.
+
+    """
+    nb_images = len(images)
+    if interpolations is None:
+        interpolations = [None] * nb_images
+
+    result = list(images)
+    keys = []
+    for image, size, interpolation in zip(images, sizes, interpolations):
+        size = (int(size[0]), int(size[1]))
+        if image.shape[0:2] == size:
+            keys.append(None)
+        else:
+            keys.append((image.shape, image.dtype.name, interpolation, size))
+
+    groups = _group_indices_by_key(keys)
+    for key, indices in groups.items():
+        if key is None:
+            continue
+        _shape, _dtype, interpolation, size = key
+        group_rs = imresize_many_images(
+            _stack_by_indices(images, indices), sizes=size,
+            interpolation=interpolation, nb_threads=nb_threads)
+        for idx, image_rs in zip(indices, group_rs):
+            result[idx] = image_rs
     return result
 
 
@@ -1744,6 +1865,20 @@ def median_pool(arr, block_size, pad_mode="reflect", pad_cval=128,
     if valid_for_cv2:
         return _median_pool_cv2(arr, block_size[0], pad_mode=pad_mode,
                                 pad_cval=pad_cval)
+
+    valid_for_hist = (
+        _NUMBA_INSTALLED
+        and arr.dtype.name in ["uint8", "uint16"]
+        and len(block_size) == 2
+        and block_size[0] == block_size[1]
+        and block_size[0] % 2 == 1
+        and block_size[0] > 1
+        and 0 not in shape
+    )
+    if valid_for_hist:
+        return _median_pool_hist(arr, block_size[0], pad_mode=pad_mode,
+                                 pad_cval=pad_cval)
+
     return pool(arr, block_size, np.median, pad_mode=pad_mode,
                 pad_cval=pad_cval, preserve_dtype=preserve_dtype)
 
@@ -1776,6 +1911,30 @@ def _median_pool_cv2(arr, block_size, pad_mode, pad_cval):
     return arr[start_height::block_size, start_width::block_size]
 
 
+# Same as _median_pool_cv2(), but based on a sliding histogram median
+# filter, which supports any odd block size and uint16 inputs.
+# Added in 0.5.0.
+def _median_pool_hist(arr, block_size, pad_mode, pad_cval):
+    from imgaug.augmenters.blur import blur_median_hist
+    from imgaug.augmenters.size import pad_to_multiples_of
+
+    shape = arr.shape
+    if shape[0] % block_size != 0 or shape[1] % block_size != 0:
+        arr = pad_to_multiples_of(
+            arr,
+            height_multiple=block_size,
+            width_multiple=block_size,
+            mode=pad_mode,
+            cval=pad_cval
+        )
+
+    arr = blur_median_hist(arr, block_size)
+
+    start_height = (block_size - 1) // 2
+    start_width = (block_size - 1) // 2
+    return arr[start_height::block_size, start_width::block_size]
+
+
 def draw_grid(images, rows=None, cols=None):
     """Combine multiple images into a single grid-like image.
 
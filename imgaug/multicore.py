@@ -1,6 +1,7 @@
 """Classes and functions dealing with augmentation on multiple CPU cores."""
 from __future__ import print_function, division, absolute_import
 import sys
+import collections
 import multiprocessing
 import threading
 import traceback
@@ -13,7 +14,8 @@ import cv2
 
 import imgaug.imgaug as ia
 import imgaug.random as iarandom
-from imgaug.augmentables.batches import Batch, UnnormalizedBatch
+from imgaug.augmentables.batches import (Batch, UnnormalizedBatch,
+                                         _AUGMENTABLE_NAMES)
 
 if sys.version_info[0] == 2:
     # pylint: disable=redefined-builtin, import-error
@@ -558,6 +560,342 @@ def _derive_seed(base_seed, offset=0):
     )
 
 
+class BatchStream(object):
+    """Augment batches from an iterable in background threads.
+
+    In contrast to :class:`Pool`, this class augments batches in threads of
+    the current process, i.e. batches are never pickled. Backpressure is
+    based on the measured size of the batches in bytes: No new batch is
+    loaded from the source while the batches in the pipeline -- i.e.
+    batches currently being augmented and augmented batches waiting to be
+    consumed -- exceed `max_bytes`. This keeps memory usage flat even for
+    long-running streams of variably sized images. As a batch contains both
+    inputs and outputs after augmentation, twice a loaded batch's size is
+    reserved until its actual size after augmentation is known.
+
+    The stream is shut down via :func:`BatchStream.close`, which is
+    automatically called when the stream is exhausted, when it is used as a
+    context manager and the context is left, or when the generator returned
+    by iterating over the stream is closed (e.g. by breaking out of a
+    ``for`` loop and discarding the generator).
+
+    Added in 0.5.0.
+
+    Parameters
+    ----------
+    augseq : imgaug.augmenters.meta.Augmenter
+        The augmentation sequence to apply to batches.
+
+    batches : iterable of imgaug.augmentables.batches.Batch or iterable of imgaug.augmentables.batches.UnnormalizedBatch
+        The batches to augment. May be a generator.
+
+    max_bytes : None or int, optional
+        Maximum summed size in bytes of all batches in the pipeline.
+        A batch that alone exceeds this value is still processed, but only
+        once the pipeline is otherwise empty.
+        If ``None``, the size is not limited.
+
+    prefetch : None or int, optional
+        Maximum number of batches in the pipeline.
+        If ``None``, the number of batches is only limited by `max_bytes`.
+
+    ordered : bool, optional
+        Whether to yield the batches in the same order as they were
+        provided by `batches`. If ``False``, batches are yielded as soon as
+        their augmentation finished.
+
+    nb_workers : int, optional
+        Number of threads that augment batches. Note that many operations
+        within augmenters (e.g. in ``cv2``) release the GIL.
+
+    seed : None or int, optional
+        Seed to use for the augmentation. If provided, each batch is
+        augmented with a seed derived from this value and the batch's
+        index, making the results independent of `nb_workers`.
+        If ``None`` and `nb_workers` is ``1``, `augseq` itself is used and
+        its random state is advanced as in
+        :func:`~imgaug.augmenters.meta.Augmenter.augment_batches`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import imgaug.augmenters as iaa
+    >>> from imgaug.augmentables.batches import UnnormalizedBatch
+    >>> from imgaug.multicore import BatchStream
+    >>>
+    >>> aug = iaa.Add(1)
+    >>> batches = (
+    >>>     UnnormalizedBatch(images=np.zeros((4, 64, 64, 3), dtype=np.uint8))
+    >>>     for _ in range(100))
+    >>> with BatchStream(aug, batches, max_bytes=2**20) as stream:
+    >>>     for batch_aug in stream:
+    >>>         pass
+
+    """
+
+    def __init__(self, augseq, batches, max_bytes=None, prefetch=None,
+                 ordered=True, nb_workers=1, seed=None):
+        assert max_bytes is None or max_bytes > 0, (
+            "Expected `max_bytes` to be `None` or greater than zero, got "
+            "%s." % (str(max_bytes),))
+        assert prefetch is None or prefetch >= 1, (
+            "Expected `prefetch` to be `None` or at least 1, got %s." % (
+                str(prefetch),))
+        assert nb_workers >= 1, (
+            "Expected `nb_workers` to be at least 1, got %d." % (
+                nb_workers,))
+
+        self.augseq = augseq
+        self.max_bytes = max_bytes
+        self.prefetch = prefetch
+        self.ordered = ordered
+        self.nb_workers = nb_workers
+        self.seed = seed
+
+        self._source = iter(batches)
+        self._source_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._nb_loaded = 0
+        self._nb_yielded = 0
+        self._source_exhausted = False
+        self._closed = False
+        self._error = None
+        self._results = collections.OrderedDict()
+        self._nb_batches_in_pipeline = 0
+        self._nb_bytes_in_pipeline = 0
+        self._nbytes_in_augmentation = {}
+
+        self._workers = []
+        augseqs = self._create_worker_augseqs()
+        for augseq_worker in augseqs:
+            worker = threading.Thread(target=self._work,
+                                      args=(augseq_worker,))
+            worker.daemon = True
+            self._workers.append(worker)
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def nb_bytes_in_pipeline(self):
+        """Get the summed size of all batches currently in the pipeline.
+
+        Added in 0.5.0.
+
+        Returns
+        -------
+        int
+            Size in bytes.
+
+        """
+        with self._cond:
+            return self._nb_bytes_in_pipeline
+
+    def _create_worker_augseqs(self):
+        if self.nb_workers == 1 and self.seed is None:
+            return [self.augseq]
+
+        augseqs = [self.augseq.deepcopy() for _ in range(self.nb_workers)]
+        if self.seed is None:
+            seeds = self.augseq.random_state.generate_seeds_(self.nb_workers)
+            for augseq_worker, seed in zip(augseqs, seeds):
+                augseq_worker.seed_(seed)
+        return augseqs
+
+    def __iter__(self):
+        try:
+            while True:
+                batch = self._get_next_result()
+                if batch is None:
+                    break
+                yield batch
+        finally:
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Stop loading and augmenting batches and wait for the workers.
+
+        Batches that are currently being augmented are finished, but not
+        yielded anymore.
+
+        Added in 0.5.0.
+
+        """
+        with self._cond:
+            self._closed = True
+            self._results.clear()
+            self._cond.notify_all()
+
+        current_thread = threading.current_thread()
+        for worker in self._workers:
+            if worker is not current_thread:
+                worker.join()
+
+    def _get_next_result(self):
+        with self._cond:
+            while True:
+                if self._error is not None:
+                    error = self._error
+                    self._error = None
+                    raise error
+
+                key = self._nb_yielded if self.ordered else None
+                if key is None and self._results:
+                    key = next(iter(self._results))
+                if key is not None and key in self._results:
+                    batch, nbytes = self._results.pop(key)
+                    self._nb_yielded += 1
+                    self._release(nbytes)
+                    return batch
+
+                all_yielded = (
+                    self._source_exhausted
+                    and self._nb_yielded == self._nb_loaded)
+                if all_yielded or self._closed:
+                    return None
+
+                self._cond.wait()
+
+    def _work(self, augseq):
+        try:
+            while True:
+                batch_idx, batch = self._load_next_batch()
+                if batch is None:
+                    return
+
+                if self.seed is not None:
+                    augseq.seed_(_derive_seed(self.seed, batch_idx))
+                batch_aug = augseq.augment_batch_(batch)
+
+                nbytes_aug = _estimate_batch_nbytes(batch_aug)
+                with self._cond:
+                    if self._closed:
+                        return
+                    nbytes = self._nbytes_in_augmentation.pop(batch_idx)
+                    self._nb_bytes_in_pipeline += nbytes_aug - nbytes
+                    self._results[batch_idx] = (batch_aug, nbytes_aug)
+                    self._cond.notify_all()
+        except Exception as exc:  # pylint: disable=broad-except
+            with self._cond:
+                self._error = exc
+                self._closed = True
+                self._cond.notify_all()
+
+    def _load_next_batch(self):
+        with self._source_lock:
+            with self._cond:
+                if self._closed or self._source_exhausted:
+                    return None, None
+
+            try:
+                batch = next(self._source)
+            except StopIteration:
+                with self._cond:
+                    self._source_exhausted = True
+                    self._cond.notify_all()
+                return None, None
+
+            assert isinstance(batch, (UnnormalizedBatch, Batch)), (
+                "Expected `batches` to only contain instances of "
+                "`imgaug.augmentables.batches.UnnormalizedBatch` or "
+                "`imgaug.augmentables.batches.Batch`. Got type %s "
+                "instead." % (type(batch),))
+
+            # Augmentation adds outputs to the batch while its inputs are
+            # kept. We hence reserve twice the input's size, assuming that
+            # augmentation roughly preserves the size. The reservation is
+            # corrected once the batch was augmented.
+            nbytes = 2 * _estimate_batch_nbytes(batch)
+            with self._cond:
+                while not self._closed and not self._has_capacity(nbytes):
+                    self._cond.wait()
+                if self._closed:
+                    return None, None
+
+                batch_idx = self._nb_loaded
+                self._nb_loaded += 1
+                self._nb_batches_in_pipeline += 1
+                self._nb_bytes_in_pipeline += nbytes
+                self._nbytes_in_augmentation[batch_idx] = nbytes
+            return batch_idx, batch
+
+    def _has_capacity(self, nbytes):
+        if self._nb_batches_in_pipeline == 0:
+            return True
+        if (self.prefetch is not None
+                and self._nb_batches_in_pipeline >= self.prefetch):
+            return False
+        if (self.max_bytes is not None
+                and self._nb_bytes_in_pipeline + nbytes > self.max_bytes):
+            return False
+        return True
+
+    def _release(self, nbytes):
+        self._nb_batches_in_pipeline -= 1
+        self._nb_bytes_in_pipeline -= nbytes
+        self._cond.notify_all()
+
+
+def _estimate_batch_nbytes(batch):
+    """Estimate the size in bytes of the augmentables in a batch.
+
+    Added in 0.5.0.
+
+    """
+    nbytes = 0
+    for name in _AUGMENTABLE_NAMES:
+        for postfix in ["_unaug", "_aug"]:
+            nbytes += _estimate_nbytes(getattr(batch, name + postfix, None))
+    return nbytes
+
+
+def _estimate_nbytes(value):
+    """Estimate the size in bytes of an augmentable or a list of them.
+
+    Added in 0.5.0.
+
+    """
+    if value is None:
+        return 0
+    if ia.is_np_array(value):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum([_estimate_nbytes(item) for item in value])
+    if hasattr(value, "arr_0to1"):
+        return value.arr_0to1.nbytes
+    if hasattr(value, "arr"):
+        return value.arr.nbytes
+    if hasattr(value, "to_xy_array"):
+        # Derive the size from the number of points instead of calling
+        # to_xy_array(), which would allocate a copy of all coordinates.
+        # Coordinates are stored as two float32 values per point.
+        return _count_points(value) * 2 * 4
+    return 0
+
+
+def _count_points(cbaoi):
+    """Count the points in a coordinate-based augmentable on an image.
+
+    Added in 0.5.0.
+
+    """
+    # pylint: disable=protected-access
+    if getattr(cbaoi, "_ragged", None) is not None:
+        return cbaoi._ragged.nb_points
+    if hasattr(cbaoi, "bounding_boxes"):
+        return 2 * len(cbaoi.bounding_boxes)
+    if hasattr(cbaoi, "polygons"):
+        return sum([len(poly.exterior) for poly in cbaoi.polygons])
+    if hasattr(cbaoi, "line_strings"):
+        return sum([len(ls.coords) for ls in cbaoi.line_strings])
+    return len(cbaoi.items)
+
+
 class BatchLoader(object):
     """**Deprecated**. Load batches in the background.
 
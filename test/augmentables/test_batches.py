@@ -14,6 +14,7 @@ except ImportError:
     import mock
 
 import numpy as np
+import cv2
 
 import imgaug as ia
 import imgaug.augmenters as iaa
@@ -274,6 +275,16 @@ class TestBatch(unittest.TestCase):
         assert batch_inaug.images.shape == (1, 2, 2, 3)
         assert batch_inaug.get_column_names() == ["images"]
 
+    def test_to_batch_in_augmentation__does_not_change_input(self):
+        images = np.zeros((1, 2, 2, 3), dtype=np.uint8)
+        batch = ia.Batch(images=images)
+
+        batch_inaug = batch.to_batch_in_augmentation()
+        batch_inaug.images[...] = 255
+
+        assert np.all(batch.images_unaug == 0)
+        assert batch_inaug.images is not images
+
     def test_to_batch_in_augmentation__all_columns(self):
         batch = ia.Batch(
             images=np.zeros((1, 2, 2, 3), dtype=np.uint8),
@@ -877,3 +888,98 @@ class Test_BatchInAugmentation(unittest.TestCase):
         assert np.max(batch_copy.bounding_boxes) == 4
         assert np.max(batch_copy.polygons) == 5
         assert np.max(batch_copy.line_strings) == 6
+
+    def test_deepcopy_copies_images_colorspaces(self):
+        batch = _BatchInAugmentation(
+            images=np.zeros((2, 1, 1, 3), dtype=np.uint8))
+        batch.images_colorspaces = [("HSV", "RGB"), None]
+
+        batch_copy = batch.deepcopy()
+        batch_copy.images_colorspaces[1] = ("HSV", "RGB")
+
+        assert batch.images_colorspaces == [("HSV", "RGB"), None]
+
+    def test_subselect_and_invert_images_colorspaces(self):
+        batch = _BatchInAugmentation(
+            images=np.zeros((3, 1, 1, 3), dtype=np.uint8))
+        batch.images_colorspaces = [("HSV", "RGB"), None, ("Lab", "RGB")]
+
+        batch_sub = batch.subselect_rows_by_indices([0, 1])
+        assert batch_sub.images_colorspaces == [("HSV", "RGB"), None]
+
+        batch_sub.images_colorspaces = [None, ("HLS", "RGB")]
+        batch = batch.invert_subselect_rows_by_indices_([0, 1], batch_sub)
+        assert batch.images_colorspaces == [
+            None, ("HLS", "RGB"), ("Lab", "RGB")]
+
+    def test_apply_deferred_colorspaces_(self):
+        image_rgb = np.uint8([[[255, 0, 0]]])
+        image_hsv = cv2.cvtColor(image_rgb, cv2.COLOR_RGB2HSV)
+        batch = _BatchInAugmentation(images=[np.copy(image_hsv),
+                                             np.copy(image_rgb)])
+        batch.images_colorspaces = [("HSV", "RGB"), None]
+
+        batch = batch.apply_deferred_colorspaces_()
+
+        assert batch.images_colorspaces is None
+        assert np.array_equal(batch.images[0], image_rgb)
+        assert np.array_equal(batch.images[1], image_rgb)
+
+    def test_deepcopy_is_copy_on_write(self):
+        images = np.zeros((2, 4, 4, 3), dtype=np.uint8)
+        batch = _BatchInAugmentation(images=images)
+
+        batch_copy = batch.deepcopy()
+        batch_copy.images[...] = 255
+
+        assert np.all(batch.images == 0)
+        assert np.all(batch_copy.images == 255)
+
+    def test_deepcopy_last_owner_receives_value_without_copy(self):
+        images = np.zeros((2, 4, 4, 3), dtype=np.uint8)
+        batch = _BatchInAugmentation(images=images)
+
+        batch_copy = batch.deepcopy()
+        batch.images = None
+
+        assert batch_copy.images is images
+
+    def test_deepcopy_does_not_copy_on_shape_queries(self):
+        images = np.zeros((2, 4, 4, 3), dtype=np.uint8)
+        batch = _BatchInAugmentation(images=images)
+
+        batch_copy = batch.deepcopy()
+        nb_rows = batch_copy.nb_rows
+        column_names = batch_copy.get_column_names()
+        shapes = batch_copy.get_rowwise_shapes()
+        batch.images = None
+
+        assert nb_rows == 2
+        assert column_names == ["images"]
+        assert shapes == [(4, 4, 3), (4, 4, 3)]
+        assert batch_copy.images is images
+
+    def test_detach_and_reattach_column_values_does_not_copy(self):
+        images = np.zeros((2, 4, 4, 3), dtype=np.uint8)
+        batch = _BatchInAugmentation(images=images)
+
+        batch_copy = batch.deepcopy()
+        detached = batch_copy._detach_column_values_()
+        assert batch_copy.empty
+        batch_copy._reattach_column_values_(detached)
+        batch.images = None
+
+        assert batch_copy.images is images
+
+    def test_deactivated_augmenter_does_not_copy_columns(self):
+        from imgaug import augmenters as iaa
+        images = np.zeros((2, 4, 4, 3), dtype=np.uint8)
+        batch = _BatchInAugmentation(images=images)
+        aug = iaa.Identity()
+        aug.activated = False
+
+        batch_copy = batch.deepcopy()
+        batch_aug = aug.augment_batch_(batch_copy)
+        batch.images = None
+
+        assert batch_aug.images is images
@@ -2157,6 +2157,74 @@ class TestLineStringsOnImage_shift(TestLineStringsOnImage_shift_):
 #      test invert_to_keypoints_on_image()
 #      test to_xy_array()
 #      test fill_from_xy_array_()
+class TestLineStringsOnImage_from_ragged_xy_array(unittest.TestCase):
+    @classmethod
+    def _create_lsoi(cls, labels=None):
+        xy = np.float32([
+            [0, 0], [10, 0],
+            [20, 20], [30, 20], [30, 30]
+        ])
+        return LineStringsOnImage.from_ragged_xy_array(
+            xy, [0, 2, 5], shape=(40, 40, 3), labels=labels)
+
+    def test_line_strings_are_created_on_demand(self):
+        lsoi = self._create_lsoi(labels=["a", "b"])
+
+        assert lsoi._line_strings is None
+        assert len(lsoi) == 2
+        lss = lsoi.line_strings
+
+        assert lsoi._ragged is None
+        assert len(lss) == 2
+        assert lss[0].coords_almost_equals([(0, 0), (10, 0)])
+        assert lss[1].coords_almost_equals([(20, 20), (30, 20), (30, 30)])
+        assert lss[0].label == "a"
+        assert lss[1].label == "b"
+
+    def test_closing_points_are_kept(self):
+        xy = np.float32([[0, 0], [10, 0], [10, 10], [0, 0]])
+        lsoi = LineStringsOnImage.from_ragged_xy_array(xy, [0, 4],
+                                                       shape=(40, 40, 3))
+
+        assert len(lsoi.line_strings[0].coords) == 4
+
+    def test_to_ragged_xy_array(self):
+        lsoi = LineStringsOnImage([
+            LineString([(0, 0), (10, 0)]),
+            LineString([(1, 1), (2, 1), (2, 2)])
+        ], shape=(20, 20, 3))
+
+        xy, offsets = lsoi.to_ragged_xy_array()
+
+        assert np.allclose(xy, lsoi.to_xy_array())
+        assert np.array_equal(offsets, [0, 2, 5])
+
+    def test_coordinate_methods_do_not_create_line_strings(self):
+        lsoi = self._create_lsoi()
+
+        lsoi.shift_(x=1, y=2)
+        lsoi = lsoi.on_((80, 80, 3))
+        lsoi.fill_from_xy_array_(lsoi.to_xy_array() + 1)
+        kpsoi = lsoi.to_keypoints_on_image()
+        lsoi.invert_to_keypoints_on_image_(kpsoi)
+        lsoi_copy = lsoi.copy()
+        lsoi_deepcopy = lsoi.deepcopy()
+
+        for lsoi_i in [lsoi, lsoi_copy, lsoi_deepcopy]:
+            assert lsoi_i._line_strings is None
+        assert lsoi.line_strings[0].coords_almost_equals(
+            [(3, 5), (23, 5)])
+
+    def test_deepcopy_is_independent(self):
+        lsoi = self._create_lsoi()
+
+        lsoi_copy = lsoi.deepcopy()
+        lsoi.shift_(x=1)
+
+        assert np.allclose(lsoi_copy.to_xy_array()[0], [0, 0])
+        assert np.allclose(lsoi.to_xy_array()[0], [1, 0])
+
+
 class TestLineStringsOnImage(unittest.TestCase):
     def setUp(self):
         reseed()
@@ -21,7 +21,11 @@ import shapely.geometry
 import imgaug as ia
 import imgaug.random as iarandom
 from imgaug.testutils import reseed, wrap_shift_deprecation, assertWarns
-from imgaug.augmentables.polys import _ConcavePolygonRecoverer
+from imgaug.augmentables.polys import (
+    _ConcavePolygonRecoverer,
+    _find_segment_intersections,
+    _is_polygon_convex,
+    recover_psois_)
 
 
 class TestPolygon___init__(unittest.TestCase):
@@ -220,6 +224,19 @@ class TestPolygon_is_valid(unittest.TestCase):
         poly = ia.Polygon([(0, 0), (1, 0), (1, 0), (1, 1), (0, 1)])
         assert poly.is_valid
 
+    def test_concave_polygon(self):
+        poly = ia.Polygon([(0, 0), (2, 0), (1, 1), (2, 2), (0, 2)])
+        assert poly.is_valid
+
+    def test_pentagram(self):
+        # convex turns at every point, but winds twice around the center
+        poly = ia.Polygon([(50, 0), (79, 91), (2, 35), (98, 35), (21, 91)])
+        assert not poly.is_valid
+
+    def test_polygon_with_spike(self):
+        poly = ia.Polygon([(0, 0), (2, 0), (1, 0), (1, 1), (0, 1)])
+        assert not poly.is_valid
+
 
 class TestPolygon_area(unittest.TestCase):
     def test_square_polygon(self):
@@ -246,6 +263,14 @@ class TestPolygon_area(unittest.TestCase):
         poly = ia.Polygon([])
         assert np.isclose(poly.area, 0.0)
 
+    def test_concave_polygon(self):
+        poly = ia.Polygon([(0, 0), (2, 0), (1, 1), (2, 2), (0, 2)])
+        assert np.isclose(poly.area, 3.0)
+
+    def test_self_intersecting_polygon_matches_shapely(self):
+        poly = ia.Polygon([(0, 0), (10, 10), (10, 0), (0, 10), (-2, 5)])
+        assert np.isclose(poly.area, poly.to_shapely_polygon().area)
+
 
 class TestPolygon_height(unittest.TestCase):
     def test_square_polygon(self):
@@ -860,6 +885,58 @@ class TestPolygon_clip_out_of_image(unittest.TestCase):
         assert len(multipoly_clipped) == 0
 
 
+class TestPolygon_clip_out_of_image_convex_matches_shapely(
+        unittest.TestCase):
+    @classmethod
+    def _clip_via_shapely(cls, poly, height, width):
+        from imgaug.augmentables.polys import (
+            _convert_shapely_clip_result_to_polygons)
+        poly_image = shapely.geometry.box(0, 0, width, height)
+        inter = poly.to_shapely_polygon().intersection(poly_image)
+        return _convert_shapely_clip_result_to_polygons(
+            inter, poly, height, width)
+
+    def _assert_same_as_shapely(self, poly, height=100, width=100):
+        observed = poly.clip_out_of_image((height, width, 3))
+        expected = self._clip_via_shapely(poly, height, width)
+        assert len(observed) == len(expected)
+        for poly_obs, poly_exp in zip(observed, expected):
+            assert poly_obs.label == poly_exp.label
+            assert np.allclose(poly_obs.exterior, poly_exp.exterior,
+                               atol=1e-4, rtol=0)
+
+    def test_rectangles(self):
+        exteriors = [
+            [(10, 10), (20, 10), (20, 20), (10, 20)],
+            [(10, 10), (10, 20), (20, 20), (20, 10)],
+            [(-10, 10), (20, 10), (20, 20), (-10, 20)],
+            [(-10, -10), (200, -10), (200, 200), (-10, 200)],
+            [(0, 0), (100, 0), (100, 100), (0, 100)],
+            [(100, 0), (200, 0), (200, 100), (100, 100)]
+        ]
+        for exterior in exteriors:
+            with self.subTest(exterior=exterior):
+                self._assert_same_as_shapely(ia.Polygon(exterior,
+                                                        label="foo"))
+
+    def test_collinear_points(self):
+        poly = ia.Polygon([(10, 10), (30, 10), (150, 10), (150, 50),
+                           (10, 50)])
+        self._assert_same_as_shapely(poly)
+
+    def test_random_convex_polygons(self):
+        rng = iarandom.RNG(0)
+        for _ in sm.xrange(200):
+            nb_points = rng.integers(3, 12)
+            angles = np.sort(rng.uniform(0, 2*np.pi, size=(nb_points,)))
+            radius = rng.uniform(5, 80)
+            center = rng.uniform(-40, 140, size=(2,))
+            exterior = np.stack([center[0] + radius * np.cos(angles),
+                                 center[1] + radius * np.sin(angles)],
+                                axis=-1)
+            self._assert_same_as_shapely(ia.Polygon(exterior))
+
+
 class TestPolygon_shift_(unittest.TestCase):
     @property
     def _is_inplace(self):
@@ -2714,6 +2791,217 @@ class TestPolygonsOnImage_clip_out_of_image_(unittest.TestCase):
         else:
             assert poly_oi_clip is not poly_oi
 
+    def test_mixed_convex_concave_and_line_polygons(self):
+        polys = [
+            ia.Polygon([(1, 1), (15, 1), (15, 9), (1, 9)], label="a"),
+            ia.Polygon([(-5, 2), (20, 2), (5, 5), (20, 8), (-5, 8)],
+                       label="b"),
+            ia.Polygon([(2, 2), (20, 2)], label="c"),
+            ia.Polygon([(100, 100), (200, 100), (200, 200)], label="d"),
+            ia.Polygon([(2, -5), (6, 5), (2, 15)], label="e")
+        ]
+        poly_oi = ia.PolygonsOnImage(polys, shape=(10, 11, 3))
+
+        poly_oi_clip = self._func(poly_oi)
+
+        expected = [
+            poly_clipped
+            for poly in polys
+            for poly_clipped in poly.clip_out_of_image((10, 11, 3))]
+        assert len(poly_oi_clip.polygons) == len(expected)
+        for poly_obs, poly_exp in zip(poly_oi_clip.polygons, expected):
+            assert poly_obs.label == poly_exp.label
+            assert poly_obs.exterior_almost_equals(poly_exp)
+        assert [poly.label for poly in poly_oi_clip.polygons] == [
+            "a", "b", "c", "e"]
+
+
+class TestPolygonsOnImage_from_ragged_xy_array(unittest.TestCase):
+    @classmethod
+    def _create_psoi(cls, labels=None):
+        xy = np.float32([
+            [0, 0], [10, 0], [10, 10],
+            [20, 20], [30, 20], [30, 30], [20, 30]
+        ])
+        return ia.PolygonsOnImage.from_ragged_xy_array(
+            xy, [0, 3, 7], shape=(40, 40, 3), labels=labels)
+
+    def test_polygons_are_created_on_demand(self):
+        psoi = self._create_psoi(labels=["a", "b"])
+
+        assert psoi._polygons is None
+        assert len(psoi) == 2
+        assert not psoi.empty
+        polys = psoi.polygons
+
+        assert psoi._ragged is None
+        assert len(polys) == 2
+        assert polys[0].coords_almost_equals([(0, 0), (10, 0), (10, 10)])
+        assert polys[1].coords_almost_equals(
+            [(20, 20), (30, 20), (30, 30), (20, 30)])
+        assert polys[0].label == "a"
+        assert polys[1].label == "b"
+
+    def test_input_array_is_copied(self):
+        xy = np.float32([[0, 0], [10, 0], [10, 10]])
+        psoi = ia.PolygonsOnImage.from_ragged_xy_array(xy, [0, 3],
+                                                        shape=(20, 20, 3))
+
+        psoi.shift_(x=1)
+
+        assert np.allclose(xy, [[0, 0], [10, 0], [10, 10]])
+
+    def test_closing_points_are_removed(self):
+        xy = np.float32([[0, 0], [10, 0], [10, 10], [0, 0],
+                         [20, 20], [30, 20], [30, 30]])
+        psoi = ia.PolygonsOnImage.from_ragged_xy_array(xy, [0, 4, 7],
+                                                        shape=(40, 40, 3))
+
+        _, offsets = psoi.to_ragged_xy_array()
+
+        assert np.array_equal(offsets, [0, 3, 6])
+        assert len(psoi.polygons[0].exterior) == 3
+
+    def test_zero_polygons(self):
+        psoi = ia.PolygonsOnImage.from_ragged_xy_array(
+            np.zeros((0, 2), dtype=np.float32), [0], shape=(10, 10, 3))
+
+        assert psoi.empty
+        assert psoi.to_xy_array().shape == (0, 2)
+        assert psoi.polygons == []
+
+    def test_to_ragged_xy_array(self):
+        psoi = self._create_psoi()
+
+        xy, offsets = psoi.to_ragged_xy_array()
+
+        assert xy.dtype.name == "float32"
+        assert xy.shape == (7, 2)
+        assert np.array_equal(offsets, [0, 3, 7])
+
+    def test_to_ragged_xy_array_from_polygon_objects(self):
+        psoi = ia.PolygonsOnImage([
+            ia.Polygon([(0, 0), (10, 0), (10, 10)]),
+            ia.Polygon([(1, 1), (2, 1), (2, 2), (1, 2)])
+        ], shape=(20, 20, 3))
+
+        xy, offsets = psoi.to_ragged_xy_array()
+
+        assert np.allclose(xy, psoi.to_xy_array())
+        assert np.array_equal(offsets, [0, 3, 7])
+
+    def test_coordinate_methods_do_not_create_polygons(self):
+        psoi = self._create_psoi()
+
+        psoi.shift_(x=1, y=2)
+        psoi = psoi.on_((80, 80, 3))
+        psoi.fill_from_xy_array_(psoi.to_xy_array() + 1)
+        kpsoi = psoi.to_keypoints_on_image()
+        psoi.invert_to_keypoints_on_image_(kpsoi)
+        psoi_copy = psoi.copy()
+        psoi_deepcopy = psoi.deepcopy()
+        areas = psoi.compute_areas()
+        validity = psoi.compute_validity()
+
+        for psoi_i in [psoi, psoi_copy, psoi_deepcopy]:
+            assert psoi_i._polygons is None
+        assert np.allclose(areas, [200.0, 400.0])
+        assert np.all(validity)
+        assert psoi.polygons[0].coords_almost_equals(
+            [(3, 5), (23, 5), (23, 25)])
+
+    def test_deepcopy_is_independent(self):
+        psoi = self._create_psoi()
+
+        psoi_copy = psoi.deepcopy()
+        psoi.shift_(x=1)
+
+        assert np.allclose(psoi_copy.to_xy_array()[0], [0, 0])
+        assert np.allclose(psoi.to_xy_array()[0], [1, 0])
+
+    def test_setting_polygons_replaces_ragged_array(self):
+        psoi = self._create_psoi()
+
+        psoi.polygons = [ia.Polygon([(1, 1), (2, 1), (2, 2)])]
+
+        assert len(psoi) == 1
+        assert np.allclose(psoi.to_xy_array(), [[1, 1], [2, 1], [2, 2]])
+
+
+class Test_recover_psois_(unittest.TestCase):
+    def test_valid_ragged_polygons_are_not_recovered(self):
+        xy = np.float32([[0, 0], [10, 0], [10, 10]])
+        psoi = ia.PolygonsOnImage.from_ragged_xy_array(xy, [0, 3],
+                                                        shape=(20, 20, 3))
+        recoverer = mock.Mock()
+
+        psoi_rec = recover_psois_(psoi, psoi.deepcopy(), recoverer, None)
+
+        assert recoverer.recover_from.call_count == 0
+        assert psoi_rec._polygons is None
+
+    def test_invalid_ragged_polygons_are_recovered(self):
+        xy = np.float32([[0, 0], [10, 10], [10, 0], [0, 10]])
+        psoi = ia.PolygonsOnImage.from_ragged_xy_array(xy, [0, 4],
+                                                        shape=(20, 20, 3))
+
+        psoi_rec = recover_psois_(psoi, psoi.deepcopy(),
+                                  _ConcavePolygonRecoverer(), 0)
+
+        assert psoi_rec.polygons[0].is_valid
+
+
+class TestPolygonsOnImage_compute_areas(unittest.TestCase):
+    def test_with_zero_polygons(self):
+        psoi = ia.PolygonsOnImage([], shape=(10, 10, 3))
+        areas = psoi.compute_areas()
+        assert areas.shape == (0,)
+
+    def test_with_various_polygons(self):
+        polys = [
+            ia.Polygon([(0, 0), (2, 0), (2, 1), (0, 1)]),
+            ia.Polygon([(0, 0), (2, 0), (1, 1), (2, 2), (0, 2)]),
+            ia.Polygon([(0, 0), (1, 1)]),
+            ia.Polygon([]),
+            ia.Polygon([(0, 0), (10, 10), (10, 0), (0, 10)])
+        ]
+        psoi = ia.PolygonsOnImage(polys, shape=(10, 10, 3))
+
+        areas = psoi.compute_areas()
+
+        assert areas.dtype.name == "float64"
+        assert np.allclose(areas, [poly.area for poly in polys])
+        assert np.allclose(areas, [2.0, 3.0, 0.0, 0.0, 0.0])
+
+
+class TestPolygonsOnImage_compute_validity(unittest.TestCase):
+    def test_with_zero_polygons(self):
+        psoi = ia.PolygonsOnImage([], shape=(10, 10, 3))
+        validity = psoi.compute_validity()
+        assert validity.shape == (0,)
+
+    def test_with_various_polygons(self):
+        polys = [
+            ia.Polygon([(0, 0), (2, 0), (2, 1), (0, 1)]),
+            ia.Polygon([(0, 0), (2, 0), (1, 1), (2, 2), (0, 2)]),
+            ia.Polygon([(0, 0), (1, 1)]),
+            ia.Polygon([]),
+            ia.Polygon([(0, 0), (10, 10), (10, 0), (0, 10)]),
+            ia.Polygon([(50, 0), (79, 91), (2, 35), (98, 35), (21, 91)]),
+            ia.Polygon([(0, 0), (1, 0), (1, 0), (1, 1), (0, 1)])
+        ]
+        psoi = ia.PolygonsOnImage(polys, shape=(10, 10, 3))
+
+        validity = psoi.compute_validity()
+
+        assert validity.dtype.name == "bool"
+        assert np.array_equal(
+            validity,
+            [True, True, False, False, False, False, True])
+        assert np.array_equal(
+            validity,
+            [poly.is_valid for poly in polys])
+
 
 class TestPolygonsOnImage_clip_out_of_image(
         TestPolygonsOnImage_clip_out_of_image_):
@@ -3240,6 +3528,123 @@ class TestPolygonsOnImage___repr___and___str__(unittest.TestCase):
         assert poly_oi.__str__() == expected
 
 
+class Test_find_segment_intersections(unittest.TestCase):
+    @classmethod
+    def _find_in_polygon(cls, points):
+        points = np.float64(points)
+        return _find_segment_intersections(points,
+                                           np.roll(points, -1, axis=0))
+
+    def test_no_segments(self):
+        result = _find_segment_intersections(np.zeros((0, 2)),
+                                             np.zeros((0, 2)))
+        assert result == []
+
+    def test_square_has_no_intersections(self):
+        result = self._find_in_polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        assert result == []
+
+    def test_bowtie(self):
+        result = self._find_in_polygon([(0, 0), (10, 10), (10, 0), (0, 10)])
+        assert len(result) == 1
+        point, segment_ids = result[0]
+        assert np.allclose(point, (5.0, 5.0))
+        assert segment_ids == [0, 2]
+
+    def test_three_segments_through_one_point(self):
+        result = self._find_in_polygon([(0, 0), (10, 10), (10, 0), (0, 10),
+                                        (5, -1), (5, 12)])
+        points = {(round(point[0], 4), round(point[1], 4)): segment_ids
+                  for point, segment_ids in result}
+        assert len(points) == 4
+        assert points[(5.0, 5.0)] == [0, 2, 4]
+
+    def test_vertex_touching_segment(self):
+        result = self._find_in_polygon([(0, 0), (10, 0), (10, 10), (5, 0),
+                                        (0, 10)])
+        assert len(result) == 1
+        point, segment_ids = result[0]
+        assert np.allclose(point, (5.0, 0.0))
+        assert segment_ids == [0, 2, 3]
+
+    def test_shared_vertex_is_no_intersection(self):
+        result = self._find_in_polygon([(0, 0), (0.5, 0.5), (1.0, 0),
+                                        (1.0, 1.0), (0.5, 0.5), (0, 1.0)])
+        assert result == []
+
+    def test_matches_brute_force_shapely_intersections(self):
+        rng = iarandom.RNG(0)
+        points = rng.uniform(0, 20, size=(15, 2))
+        segments = [shapely.geometry.LineString([points[i],
+                                                 points[(i+1) % 15]])
+                    for i in sm.xrange(15)]
+        nb_expected = 0
+        for i in sm.xrange(15):
+            for j in sm.xrange(i+2, 15):
+                if i == 0 and j == 14:
+                    continue
+                if segments[i].intersects(segments[j]):
+                    nb_expected += 1
+
+        result = self._find_in_polygon(points)
+
+        nb_observed = sum([len(segment_ids) * (len(segment_ids) - 1) // 2
+                           for _, segment_ids in result])
+        assert nb_observed == nb_expected
+
+    def test_chunk_size_does_not_change_result(self):
+        rng = iarandom.RNG(0)
+        points = rng.uniform(0, 100, size=(200, 2))
+        starts = points
+        ends = np.roll(points, -1, axis=0)
+
+        result = _find_segment_intersections(starts, ends)
+        result_chunked = _find_segment_intersections(starts, ends,
+                                                     chunk_size=7)
+
+        assert len(result) > 0
+        assert result_chunked == result
+
+    def test_distant_segments_are_not_tested(self):
+        starts = np.float32([[0, 0], [100, 100], [200, 0]])
+        ends = np.float32([[10, 10], [110, 110], [210, 10]])
+
+        with mock.patch("imgaug.augmentables.polys."
+                        "_intersect_segment_pairs") as mock_intersect:
+            result = _find_segment_intersections(starts, ends)
+
+        assert result == []
+        assert mock_intersect.call_count == 0
+
+
+class Test_is_polygon_convex(unittest.TestCase):
+    def test_convex_polygons(self):
+        exteriors = [
+            [(0, 0), (1, 0), (1, 1), (0, 1)],
+            [(0, 0), (0, 1), (1, 1), (1, 0)],
+            [(0, 0), (1, 0), (2, 0), (1, 1)],
+            [(0, 0), (1, 1), (0, 1)]
+        ]
+        for exterior in exteriors:
+            with self.subTest(exterior=exterior):
+                assert _is_polygon_convex(np.float32(exterior))
+
+    def test_non_convex_polygons(self):
+        exteriors = [
+            [],
+            [(0, 0), (1, 1)],
+            [(0, 0), (2, 0), (1, 1), (2, 2), (0, 2)],
+            [(0, 0), (10, 10), (10, 0), (0, 10)],
+            [(50, 0), (79, 91), (2, 35), (98, 35), (21, 91)],
+            [(0, 0), (1, 0), (1, 0), (1, 1)],
+            [(0, 0), (2, 0), (1, 0), (1, 1)]
+        ]
+        for exterior in exteriors:
+            with self.subTest(exterior=exterior):
+                assert not _is_polygon_convex(
+                    np.float32(exterior).reshape((-1, 2)))
+
+
 class Test_ConcavePolygonRecoverer(unittest.TestCase):
     def setUp(self):
         reseed()
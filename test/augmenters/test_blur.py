@@ -527,6 +527,124 @@ class Test_blur_avg_(unittest.TestCase):
                                              11])
 
 
+class Test_blur_median_hist(unittest.TestCase):
+    def setUp(self):
+        reseed()
+
+    @classmethod
+    def _median_naive(cls, arr, k):
+        # slow reference implementation with BORDER_REPLICATE padding
+        radius = k // 2
+        arr_pad = np.pad(arr, ((radius, radius), (radius, radius), (0, 0)),
+                         mode="edge")
+        result = np.zeros_like(arr)
+        for y in sm.xrange(arr.shape[0]):
+            for x in sm.xrange(arr.shape[1]):
+                window = arr_pad[y:y+k, x:x+k, :].reshape((-1, arr.shape[2]))
+                result[y, x, :] = np.median(window, axis=0)
+        return result
+
+    def test_uint8_matches_cv2(self):
+        rng = iarandom.RNG(0)
+        image = rng.integers(0, 255, size=(13, 17, 3), dtype=np.uint8)
+
+        for k in [3, 5, 7, 9]:
+            with self.subTest(k=k):
+                image_aug = iaa.blur_median_hist(image, k)
+
+                expected = cv2.medianBlur(image, k)
+                assert image_aug.dtype.name == "uint8"
+                assert np.array_equal(image_aug, expected)
+
+    def test_uint16(self):
+        rng = iarandom.RNG(0)
+        image = rng.integers(0, 65535, size=(9, 10, 2), dtype=np.uint16)
+
+        image_aug = iaa.blur_median_hist(image, 7)
+
+        expected = self._median_naive(image, 7)
+        assert image_aug.dtype.name == "uint16"
+        assert np.array_equal(image_aug, expected)
+
+    def test_numba_loops_directly(self):
+        # The loops are plain python functions if numba is not installed,
+        # hence we call them here directly to make sure that they are
+        # tested in both cases.
+        from imgaug.augmenters.blur import (_blur_median_hist_uint8_loop,
+                                            _blur_median_hist_uint16_loop)
+        rng = iarandom.RNG(0)
+        for dt, func in [(np.uint8, _blur_median_hist_uint8_loop),
+                         (np.uint16, _blur_median_hist_uint16_loop)]:
+            with self.subTest(dtype=np.dtype(dt).name):
+                max_value = np.iinfo(dt).max
+                images = rng.integers(0, max_value, size=(2, 6, 7, 2),
+                                      dtype=dt)
+                images_pad = np.pad(images, ((0, 0), (2, 2), (2, 2), (0, 0)),
+                                    mode="edge")
+                result = np.zeros_like(images)
+
+                func(images_pad, result, 5)
+
+                for image, image_aug in zip(images, result):
+                    assert np.array_equal(image_aug,
+                                          self._median_naive(image, 5))
+
+    def test_batch_of_images(self):
+        rng = iarandom.RNG(0)
+        images = rng.integers(0, 255, size=(4, 8, 9, 3), dtype=np.uint8)
+
+        images_aug = iaa.blur_median_hist(images, 5)
+
+        assert images_aug.shape == images.shape
+        for image, image_aug in zip(images, images_aug):
+            assert np.array_equal(image_aug, cv2.medianBlur(image, 5))
+
+    def test_hw_image(self):
+        rng = iarandom.RNG(0)
+        image = rng.integers(0, 255, size=(8, 9), dtype=np.uint8)
+
+        image_aug = iaa.blur_median_hist(image, 3)
+
+        assert image_aug.shape == (8, 9)
+        assert np.array_equal(image_aug, cv2.medianBlur(image, 3))
+
+    def test_many_channels(self):
+        rng = iarandom.RNG(0)
+        image = rng.integers(0, 255, size=(5, 6, 7), dtype=np.uint8)
+
+        image_aug = iaa.blur_median_hist(image, 3)
+
+        assert np.array_equal(image_aug, self._median_naive(image, 3))
+
+    def test_k_is_1(self):
+        image = np.arange(4*5).astype(np.uint8).reshape((4, 5, 1))
+
+        image_aug = iaa.blur_median_hist(image, 1)
+
+        assert np.array_equal(image_aug, image)
+
+    def test_zero_sized_axes(self):
+        image = np.zeros((0, 5, 3), dtype=np.uint8)
+
+        image_aug = iaa.blur_median_hist(image, 3)
+
+        assert image_aug.shape == (0, 5, 3)
+
+    def test_even_k_fails(self):
+        image = np.zeros((4, 4, 1), dtype=np.uint8)
+
+        with self.assertRaises(AssertionError):
+            _ = iaa.blur_median_hist(image, 4)
+
+    def test_unsupported_dtype_fails(self):
+        image = np.zeros((4, 4, 1), dtype=np.float32)
+
+        with self.assertRaises(ValueError):
+            _ = iaa.blur_median_hist(image, 3)
+
+
+
+
 class Test_blur_mean_shift_(unittest.TestCase):
     @property
     def image(self):
@@ -1491,6 +1609,53 @@ class TestMedianBlur(unittest.TestCase):
         expected = kpsoi
         assert keypoints_equal(observed, expected)
 
+    def test_uint16_large_kernel(self):
+        rng = iarandom.RNG(0)
+        image = rng.integers(0, 65535, size=(10, 11, 3), dtype=np.uint16)
+
+        image_aug = iaa.MedianBlur(k=7)(image=image)
+
+        expected = iaa.blur_median_hist(image, 7)
+        assert image_aug.dtype.name == "uint16"
+        assert np.array_equal(image_aug, expected)
+
+    def test_batch_with_large_kernel_matches_cv2(self):
+        rng = iarandom.RNG(0)
+        images = [
+            rng.integers(0, 255, size=(10, 11, 3), dtype=np.uint8),
+            rng.integers(0, 255, size=(10, 11, 3), dtype=np.uint8),
+            rng.integers(0, 255, size=(8, 7, 1), dtype=np.uint8)
+        ]
+
+        images_aug = iaa.MedianBlur(k=9)(images=images)
+
+        for image, image_aug in zip(images, images_aug):
+            expected = cv2.medianBlur(image, 9)
+            if expected.ndim == 2:
+                expected = expected[..., np.newaxis]
+            assert np.array_equal(image_aug, expected)
+
+    @mock.patch("imgaug.augmenters.blur.blur_median_hist")
+    def test_uint8_large_kernel_uses_cv2(self, mock_hist):
+        image = np.zeros((10, 11, 3), dtype=np.uint8)
+
+        _ = iaa.MedianBlur(k=9)(image=image)
+
+        assert mock_hist.call_count == 0
+
+    def test_uint8_more_than_512_channels(self):
+        rng = iarandom.RNG(0)
+        image = rng.integers(0, 255, size=(6, 7, 513), dtype=np.uint8)
+
+        image_aug = iaa.MedianBlur(k=5)(image=image)
+
+        expected = np.stack([
+            cv2.medianBlur(image[..., c], 5)
+            for c in sm.xrange(image.shape[-1])
+        ], axis=-1)
+        assert image_aug.shape == image.shape
+        assert np.array_equal(image_aug, expected)
+
     def test_pickleable(self):
         aug = iaa.MedianBlur((1, 11), seed=1)
         runtest_pickleable_uint8_img(aug, iterations=10)
@@ -408,6 +408,89 @@ class _BatchCapturingDummyAugmenter(iaa.Augmenter):
         return []
 
 
+class TestDeferredColorspaceConversions(unittest.TestCase):
+    @classmethod
+    def _create_images(cls):
+        image = np.arange(8*8*3).astype(np.uint8).reshape((8, 8, 3))
+        return np.stack([image, 255 - image])
+
+    @classmethod
+    def _count_conversions(cls, aug, images):
+        conversions = []
+        change_colorspace_orig = colorlib.change_colorspace_
+
+        def _side_effect(image, to_colorspace, from_colorspace=iaa.CSPACE_RGB):
+            if from_colorspace != to_colorspace:
+                conversions.append((from_colorspace, to_colorspace))
+            return change_colorspace_orig(image, to_colorspace,
+                                          from_colorspace)
+
+        with mock.patch("imgaug.augmenters.color.change_colorspace_",
+                        side_effect=_side_effect):
+            images_aug = aug(images=images)
+        return images_aug, conversions
+
+    def test_consecutive_hsv_augmenters_convert_only_once(self):
+        images = self._create_images()
+        aug = iaa.Sequential([
+            iaa.WithColorspace(iaa.CSPACE_HSV, children=iaa.Identity()),
+            iaa.AddToHue(0),
+            iaa.WithHueAndSaturation(iaa.Identity())
+        ])
+
+        images_aug, conversions = self._count_conversions(
+            aug, np.copy(images))
+
+        expected = colorlib.change_colorspaces_(
+            colorlib.change_colorspaces_(np.copy(images), iaa.CSPACE_HSV),
+            iaa.CSPACE_RGB, iaa.CSPACE_HSV)
+        assert conversions == ([(iaa.CSPACE_RGB, iaa.CSPACE_HSV)] * 2
+                               + [(iaa.CSPACE_HSV, iaa.CSPACE_RGB)] * 2)
+        assert np.array_equal(images_aug, expected)
+
+    def test_deferred_conversion_is_applied_for_non_supporting_augmenter(self):
+        images = self._create_images()
+        aug = iaa.Sequential([
+            iaa.WithColorspace(iaa.CSPACE_HSV, children=iaa.Identity()),
+            iaa.Fliplr(1.0)
+        ])
+
+        images_aug = aug(images=np.copy(images))
+
+        expected = colorlib.change_colorspaces_(
+            colorlib.change_colorspaces_(np.copy(images), iaa.CSPACE_HSV),
+            iaa.CSPACE_RGB, iaa.CSPACE_HSV)
+        assert np.array_equal(images_aug, expected[:, :, ::-1, :])
+
+    def test_deferred_conversion_is_applied_for_non_supporting_parent(self):
+        images = self._create_images()
+        aug = iaa.WithChannels(
+            [0, 1, 2],
+            iaa.WithColorspace(iaa.CSPACE_HSV, children=iaa.Identity()))
+
+        images_aug = aug(images=np.copy(images))
+
+        expected = colorlib.change_colorspaces_(
+            colorlib.change_colorspaces_(np.copy(images), iaa.CSPACE_HSV),
+            iaa.CSPACE_RGB, iaa.CSPACE_HSV)
+        assert np.array_equal(images_aug, expected)
+
+    def test_deferred_conversion_within_sometimes(self):
+        images = self._create_images()
+        aug = iaa.Sequential([
+            iaa.Sometimes(
+                1.0,
+                iaa.WithColorspace(iaa.CSPACE_HSV, children=iaa.Identity())),
+            iaa.WithColorspace(iaa.CSPACE_HSV, children=iaa.Identity())
+        ])
+
+        images_aug, conversions = self._count_conversions(
+            aug, np.copy(images))
+
+        assert conversions == ([(iaa.CSPACE_RGB, iaa.CSPACE_HSV)] * 2
+                               + [(iaa.CSPACE_HSV, iaa.CSPACE_RGB)] * 2)
+
+
 class TestWithBrightnessChannels(unittest.TestCase):
     def setUp(self):
         reseed()
@@ -1988,6 +2071,207 @@ class TestChangeColorTemperature(unittest.TestCase):
         runtest_pickleable_uint8_img(aug, iterations=10)
 
 
+class TestFusedColorLUT(unittest.TestCase):
+    def setUp(self):
+        reseed()
+
+    @classmethod
+    def _create_images(cls):
+        # large enough for the LUT to be used with the default lut_size
+        image = ia.imresize_single_image(ia.data.quokka(), (320, 320))
+        return np.stack([image] * 4)
+
+    def test___init___defaults(self):
+        aug = iaa.FusedColorLUT()
+        assert aug.lut_size == 33
+        assert isinstance(aug.children, iaa.Sequential)
+
+    def test_lut_size_2_with_identity_matches_input_exactly(self):
+        images = self._create_images()
+        aug = iaa.FusedColorLUT(iaa.Identity(), lut_size=2)
+
+        images_aug = aug(images=np.copy(images))
+
+        assert np.array_equal(images_aug, images)
+
+    def test_matches_unfused_augmenters(self):
+        images = self._create_images()
+        augs = [
+            iaa.AddToHue((-20, 20)),
+            iaa.MultiplySaturation((0.5, 1.5)),
+            iaa.MultiplyAndAddToBrightness(),
+            iaa.ChangeColorTemperature((4000, 9000)),
+            iaa.Grayscale((0.0, 0.5))
+        ]
+        aug_unfused = iaa.Sequential([aug.deepcopy() for aug in augs])
+        aug_unfused.seed_(1)
+        aug_fused = iaa.FusedColorLUT(
+            iaa.Sequential([aug.deepcopy() for aug in augs]))
+        aug_fused.children.seed_(1)
+
+        images_unfused = aug_unfused(images=np.copy(images))
+        images_fused = aug_fused(images=np.copy(images))
+
+        diff = np.abs(images_unfused.astype(np.int32)
+                      - images_fused.astype(np.int32))
+        assert np.mean(diff) < 1.0
+        assert np.percentile(diff, 99) <= 4
+
+    def test_list_of_images(self):
+        images = list(self._create_images())
+        images[1] = images[1][0:32, 0:16]
+        aug = iaa.FusedColorLUT(iaa.Add(10))
+
+        images_aug = aug(images=images)
+
+        for image, image_aug in zip(images, images_aug):
+            # interpolation error is caused by clipping at 255
+            expected = np.clip(image.astype(np.int32) + 10, 0, 255)
+            diff = np.abs(image_aug.astype(np.int32) - expected)
+            assert image_aug.shape == image.shape
+            assert np.max(diff) <= 2
+
+    def test_falls_back_to_children_for_non_fusable_augmenters(self):
+        images = self._create_images()
+        aug = iaa.FusedColorLUT(iaa.Fliplr(1.0))
+
+        images_aug = aug(images=np.copy(images))
+
+        assert np.array_equal(images_aug, images[:, :, ::-1, :])
+
+    def test_falls_back_to_children_for_non_uint8_images(self):
+        images = np.full((2, 4, 4, 3), 0.5, dtype=np.float32)
+        aug = iaa.FusedColorLUT(iaa.Multiply(2.0))
+
+        images_aug = aug(images=images)
+
+        assert images_aug.dtype.name == "float32"
+        assert np.allclose(images_aug, 1.0)
+
+    def test_uses_lut_for_large_images(self):
+        images = self._create_images()
+        aug = iaa.FusedColorLUT(iaa.Add(10))
+
+        with mock.patch("imgaug.augmenters.color.apply_color_lut_",
+                        side_effect=lambda image, lut: image) as mock_apply:
+            _ = aug(images=images)
+
+        assert mock_apply.call_count == len(images)
+
+    def test_applies_children_directly_for_small_images(self):
+        images = np.zeros((4, 64, 64, 3), dtype=np.uint8)
+        aug = iaa.FusedColorLUT(iaa.Add(10))
+
+        with mock.patch("imgaug.augmenters.color.apply_color_lut_") \
+                as mock_apply:
+            images_aug = aug(images=images)
+
+        assert mock_apply.call_count == 0
+        assert np.all(images_aug == 10)
+
+    def test_keypoints_are_not_changed(self):
+        kpsoi = ia.KeypointsOnImage([ia.Keypoint(x=1, y=2)], shape=(4, 4, 3))
+        image = np.zeros((4, 4, 3), dtype=np.uint8)
+        aug = iaa.FusedColorLUT(iaa.Add(10))
+
+        image_aug, kpsoi_aug = aug(image=image, keypoints=kpsoi)
+
+        assert np.all(image_aug == 10)
+        assert kpsoi_aug.keypoints[0].x == 1
+        assert kpsoi_aug.keypoints[0].y == 2
+
+    def test_to_deterministic(self):
+        images = self._create_images()
+        aug = iaa.FusedColorLUT(iaa.AddToHue((-50, 50))).to_deterministic()
+
+        images_aug1 = aug(images=np.copy(images))
+        images_aug2 = aug(images=np.copy(images))
+
+        assert np.array_equal(images_aug1, images_aug2)
+
+    def test_get_parameters(self):
+        aug = iaa.FusedColorLUT(lut_size=17)
+        assert aug.get_parameters() == [17]
+
+    def test_get_children_lists(self):
+        child = iaa.Add(1)
+        aug = iaa.FusedColorLUT(child)
+        assert aug.get_children_lists()[0][0] is child
+
+    def test_pickleable(self):
+        aug = iaa.FusedColorLUT(iaa.AddToHue((-50, 50)), seed=1)
+        runtest_pickleable_uint8_img(aug, iterations=3)
+
+
+class Test_is_color_lut_fusable(unittest.TestCase):
+    def test_color_augmenters(self):
+        augs = [
+            iaa.AddToHue(),
+            iaa.MultiplySaturation(),
+            iaa.MultiplyAndAddToBrightness(),
+            iaa.ChangeColorTemperature(),
+            iaa.Grayscale(),
+            iaa.Sequential([iaa.Add(1), iaa.Sometimes(0.5, iaa.Multiply(2))])
+        ]
+        for aug in augs:
+            with self.subTest(augmenter=aug.__class__.__name__):
+                assert iaa.is_color_lut_fusable(aug)
+
+    def test_non_color_augmenters(self):
+        augs = [
+            iaa.Fliplr(),
+            iaa.AdditiveGaussianNoise(),
+            iaa.Sequential([iaa.Add(1), iaa.GaussianBlur(1.0)])
+        ]
+        for aug in augs:
+            with self.subTest(augmenter=aug.__class__.__name__):
+                assert not iaa.is_color_lut_fusable(aug)
+
+
+class Test_apply_color_lut_(unittest.TestCase):
+    @classmethod
+    def _create_identity_lut(cls, size):
+        grid = colorlib._create_color_lut_grid(size)
+        return grid.reshape((size, size, size, 3))
+
+    def test_identity_lut(self):
+        image = np.arange(256*3).astype(np.uint8).reshape((16, 16, 3))
+        lut = self._create_identity_lut(18)
+
+        image_aug = colorlib.apply_color_lut_(np.copy(image), lut)
+
+        assert np.array_equal(image_aug, image)
+
+    def test_inverting_lut(self):
+        image = np.arange(256*3).astype(np.uint8).reshape((16, 16, 3))
+        lut = 255 - self._create_identity_lut(33)
+
+        image_aug = colorlib.apply_color_lut_(np.copy(image), lut)
+
+        assert np.array_equal(image_aug, 255 - image)
+
+    def test_numpy_and_numba_give_same_results(self):
+        rng = iarandom.RNG(0)
+        image = rng.integers(0, 256, size=(16, 16, 3)).astype(np.uint8)
+        lut = rng.integers(0, 256, size=(5, 5, 5, 3)).astype(np.uint8)
+        indices, weights = colorlib._get_color_lut_axis_table(5)
+
+        with mock.patch("imgaug.augmenters.color._NUMBA_INSTALLED", False):
+            image_np = colorlib.apply_color_lut_(np.copy(image), lut)
+        image_numba = colorlib.apply_color_lut_(np.copy(image), lut)
+
+        assert np.max(np.abs(image_np.astype(np.int32)
+                             - image_numba.astype(np.int32))) <= 1
+
+    def test_zero_sized_image(self):
+        image = np.zeros((0, 4, 3), dtype=np.uint8)
+        lut = self._create_identity_lut(3)
+
+        image_aug = colorlib.apply_color_lut_(image, lut)
+
+        assert image_aug.shape == (0, 4, 3)
+
+
 # Note that TestUniformColorQuantization inherits from this class,
 # which is why it contains the overwriteable @property functions
 class TestKMeansColorQuantization(unittest.TestCase):
@@ -2316,6 +2600,57 @@ class Test_quantize_colors_kmeans(unittest.TestCase):
         assert mock_warn.call_count == 1
 
 
+class TestKMeansColorQuantizationFitting(unittest.TestCase):
+    def setUp(self):
+        reseed()
+
+    def test___init___defaults(self):
+        aug = iaa.KMeansColorQuantization()
+        assert aug.fit_max_pixels is None
+        assert aug.init == "random"
+
+    def test___init___custom_parameters(self):
+        aug = iaa.KMeansColorQuantization(fit_max_pixels=1000,
+                                          init="uniform")
+        assert aug.fit_max_pixels == 1000
+        assert aug.init == "uniform"
+
+    @mock.patch("imgaug.augmenters.color.quantize_kmeans")
+    def test_parameters_are_forwarded(self, mock_quantize_func):
+        image = np.zeros((4, 4, 3), dtype=np.uint8)
+        mock_quantize_func.return_value = image
+        aug = iaa.KMeansColorQuantization(n_colors=2,
+                                          to_colorspace=iaa.CSPACE_RGB,
+                                          fit_max_pixels=1000,
+                                          init="uniform")
+
+        _ = aug(image=image)
+
+        kwargs = mock_quantize_func.call_args_list[0][1]
+        assert kwargs["fit_max_pixels"] == 1000
+        assert kwargs["init"] == "uniform"
+
+    def test_full_resolution_with_fit_max_pixels(self):
+        image = np.zeros((200, 200, 3), dtype=np.uint8)
+        image[:, 100:, :] = 255
+        aug = iaa.KMeansColorQuantization(n_colors=2,
+                                          to_colorspace=iaa.CSPACE_RGB,
+                                          max_size=None,
+                                          fit_max_pixels=500,
+                                          init="uniform")
+
+        image_aug = aug(image=image)
+
+        assert np.array_equal(image_aug, image)
+
+    def test_get_parameters(self):
+        aug = iaa.KMeansColorQuantization(fit_max_pixels=1000,
+                                          init="uniform")
+        params = aug.get_parameters()
+        assert params[-2] == 1000
+        assert params[-1] == "uniform"
+
+
 class Test_quantize_kmeans(unittest.TestCase):
     def setUp(self):
         reseed()
@@ -2386,6 +2721,108 @@ class Test_quantize_kmeans(unittest.TestCase):
         for image_quantized in images_quantized[1:]:
             assert np.array_equal(image_quantized, images_quantized[0])
 
+    def test_fit_max_pixels(self):
+        image = np.zeros((100, 100, 3), dtype=np.uint8)
+        image[:, 50:, :] = 200
+        image[50:, :, 1] = 100
+
+        image_aug = iaa.quantize_kmeans(image, 4, fit_max_pixels=100)
+
+        assert np.array_equal(image_aug, image)
+
+    def test_fit_max_pixels_is_similar_to_full_fit(self):
+        rs = iarandom.RNG(1)
+        image = rs.integers(0, 255, (100, 100, 3)).astype(np.uint8)
+
+        image_full = iaa.quantize_kmeans(image, 8)
+        image_sub = iaa.quantize_kmeans(image, 8, fit_max_pixels=1000)
+
+        error_full = np.average(
+            np.abs(image_full.astype(np.float32) - image))
+        error_sub = np.average(
+            np.abs(image_sub.astype(np.float32) - image))
+        assert len(np.unique(image_sub.reshape((-1, 3)), axis=0)) <= 8
+        assert error_sub < error_full * 1.1
+
+    def test_fit_max_pixels_below_nb_clusters(self):
+        rs = iarandom.RNG(1)
+        image = rs.integers(0, 255, (20, 20, 3)).astype(np.uint8)
+
+        image_aug = iaa.quantize_kmeans(image, 16, fit_max_pixels=4)
+
+        assert image_aug.shape == image.shape
+        assert len(np.unique(image_aug.reshape((-1, 3)), axis=0)) <= 16
+
+    def test_fit_max_pixels_is_deterministic(self):
+        rs = iarandom.RNG(1)
+        image = rs.integers(0, 255, (100, 100, 3)).astype(np.uint8)
+
+        images_quantized = [
+            iaa.quantize_kmeans(image, 20, fit_max_pixels=500)
+            for _ in sm.xrange(5)]
+
+        for image_quantized in images_quantized[1:]:
+            assert np.array_equal(image_quantized, images_quantized[0])
+
+    def test_init_uniform(self):
+        for nb_channels in [None, 1, 3]:
+            with self.subTest(nb_channels=nb_channels):
+                image = np.uint8([
+                    [0, 0, 255, 255],
+                    [0, 1, 255, 255],
+                    [0, 0, 255, 255]
+                ])
+                expected = np.uint8([
+                    [0, 0, 255, 255],
+                    [0, 0, 255, 255],
+                    [0, 0, 255, 255]
+                ])
+                if nb_channels is not None:
+                    image = np.tile(image[..., np.newaxis],
+                                    (1, 1, nb_channels))
+                    expected = np.tile(expected[..., np.newaxis],
+                                       (1, 1, nb_channels))
+
+                observed = iaa.quantize_kmeans(image, 2, init="uniform")
+
+                assert np.array_equal(observed, expected)
+
+    def test_init_uniform_fewer_occupied_bins_than_clusters(self):
+        image = np.zeros((10, 10, 3), dtype=np.uint8)
+        image[:, 5:, :] = 255
+        image[0, 0, :] = 1
+
+        image_aug = iaa.quantize_kmeans(image, 8, init="uniform")
+
+        assert image_aug.shape == image.shape
+        assert np.all(image_aug[:, 5:, :] >= 254)
+        assert np.all(image_aug[1:, 0:5, :] <= 1)
+
+    def test_init_uniform_with_fit_max_pixels(self):
+        rs = iarandom.RNG(1)
+        image = rs.integers(0, 255, (100, 100, 3)).astype(np.uint8)
+
+        image_aug = iaa.quantize_kmeans(image, 8, fit_max_pixels=1000,
+                                        init="uniform")
+
+        assert image_aug.shape == image.shape
+        assert len(np.unique(image_aug.reshape((-1, 3)), axis=0)) <= 8
+
+    def test_init_uniform_many_channels(self):
+        image = np.zeros((4, 4, 64), dtype=np.uint8)
+        image[:, 2:, :] = 255
+
+        image_aug = iaa.quantize_kmeans(image, 2, init="uniform")
+
+        assert np.all(image_aug[:, :2, :] == 0)
+        assert np.all(image_aug[:, 2:, :] >= 254)
+
+    def test_failure_if_init_is_unknown(self):
+        image = np.zeros((4, 4, 3), dtype=np.uint8)
+
+        with self.assertRaises(AssertionError):
+            _ = iaa.quantize_kmeans(image, 2, init="foo")
+
     def test_zero_sized_axes(self):
         shapes = [
             (0, 0),
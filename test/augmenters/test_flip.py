@@ -244,6 +244,30 @@ class _TestFliplrAndFlipudBase(object):
         self._test_cbaoi_p_is_1(
             "augment_line_strings", self.lsoi, self.lsoi_flipped, True)
 
+    def test_ragged_polygons_p_is_1(self):
+        psoi = self.psoi[0]
+        xy, offsets = psoi.to_ragged_xy_array()
+        psoi = ia.PolygonsOnImage.from_ragged_xy_array(
+            xy, offsets, shape=psoi.shape)
+        aug = self.create_aug(1.0)
+
+        observed = aug.augment_polygons(psoi)
+
+        assert observed._polygons is None
+        assert_cbaois_equal(observed, self.psoi_flipped[0])
+
+    def test_ragged_line_strings_p_is_1(self):
+        lsoi = self.lsoi[0]
+        xy, offsets = lsoi.to_ragged_xy_array()
+        lsoi = ia.LineStringsOnImage.from_ragged_xy_array(
+            xy, offsets, shape=lsoi.shape)
+        aug = self.create_aug(1.0)
+
+        observed = aug.augment_line_strings(lsoi)
+
+        assert observed._line_strings is None
+        assert_cbaois_equal(observed, self.lsoi_flipped[0])
+
     def test_bounding_boxes_p_is_1(self):
         self._test_cbaoi_p_is_1(
             "augment_bounding_boxes", self.bbsoi, self.bbsoi_flipped, False)
@@ -193,6 +193,72 @@ class Test__prevent_zero_sizes_after_crops_(unittest.TestCase):
                     )
 
 
+class Test__crop_and_pad_arrs_to_fixed_size(unittest.TestCase):
+    @classmethod
+    def _func(cls, *args):
+        return iaa_size._crop_and_pad_arrs_to_fixed_size(*args)
+
+    def test_matches_crop_and_pad_arr(self):
+        rng = iarandom.RNG(0)
+        images = [
+            rng.integers(0, 255, size=(10, 12, 3), dtype=np.uint8),
+            rng.integers(0, 255, size=(6, 14, 3), dtype=np.uint8),
+            rng.integers(0, 255, size=(4, 8, 3), dtype=np.uint8)
+        ]
+        croppings = [(1, 2, 1, 0), (0, 4, 0, 0), (0, 0, 0, 0)]
+        paddings = [(0, 0, 0, 0), (1, 0, 1, 0), (2, 1, 2, 1)]
+        pad_modes = ["constant", "edge", "constant"]
+        pad_cvals = [0, 10, 300]
+
+        result = self._func(images, croppings, paddings, pad_modes,
+                            pad_cvals)
+
+        assert result.shape == (3, 8, 10, 3)
+        assert result.dtype.name == "uint8"
+        for i, image in enumerate(images):
+            expected = iaa_size._crop_and_pad_arr(
+                image, croppings[i], paddings[i], pad_modes[i],
+                pad_cvals[i])
+            assert np.array_equal(result[i], expected)
+
+    def test_cval_is_clipped(self):
+        images = np.zeros((2, 2, 2, 1), dtype=np.uint8)
+
+        result = self._func(images, np.zeros((2, 4), dtype=np.int32),
+                            [(1, 0, 0, 0), (1, 0, 0, 0)],
+                            ["constant", "constant"], [-5, 300])
+
+        assert np.all(result[0, 0, :, 0] == 0)
+        assert np.all(result[1, 0, :, 0] == 255)
+        assert np.all(result[:, 1:, :, :] == 0)
+
+    def test_different_output_shapes_lead_to_none(self):
+        images = [np.zeros((2, 2, 1), dtype=np.uint8),
+                  np.zeros((3, 2, 1), dtype=np.uint8)]
+
+        result = self._func(images, np.zeros((2, 4), dtype=np.int32),
+                            np.zeros((2, 4), dtype=np.int32),
+                            ["constant", "constant"], [0, 0])
+
+        assert result is None
+
+    def test_different_dtypes_lead_to_none(self):
+        images = [np.zeros((2, 2, 1), dtype=np.uint8),
+                  np.zeros((2, 2, 1), dtype=np.float32)]
+
+        result = self._func(images, np.zeros((2, 4), dtype=np.int32),
+                            np.zeros((2, 4), dtype=np.int32),
+                            ["constant", "constant"], [0, 0])
+
+        assert result is None
+
+    def test_empty_list(self):
+        result = self._func([], np.zeros((0, 4), dtype=np.int32),
+                            np.zeros((0, 4), dtype=np.int32), [], [])
+
+        assert result is None
+
+
 class Test__handle_position_parameter(unittest.TestCase):
     def setUp(self):
         reseed()
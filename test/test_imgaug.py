@@ -3,6 +3,7 @@ from __future__ import print_function, division, absolute_import
 import time
 import warnings
 import sys
+import threading
 # unittest only added in 3.4 self.subTest()
 if sys.version_info[0] < 3 or sys.version_info[1] < 4:
     import unittest2 as unittest
@@ -23,7 +24,7 @@ import cv2
 import imgaug as ia
 from imgaug import dtypes as iadt
 import imgaug.random as iarandom
-from imgaug.testutils import assertWarns
+from imgaug.testutils import assertWarns, temporary_constants
 
 # TODO clean up this file
 
@@ -829,6 +830,77 @@ def test_imresize_many_images():
                 assert np.any(np.isclose(image_rs, expected, rtol=0, atol=1e-4))
 
 
+def test_imresize_many_images_nb_threads():
+    rng = iarandom.RNG(0)
+    images = rng.integers(0, 255, size=(5, 8, 9, 3), dtype=np.uint8)
+
+    observed_threads = ia.imresize_many_images(images, (5, 4), nb_threads=2)
+    observed = ia.imresize_many_images(images, (5, 4))
+
+    assert observed_threads.shape == (5, 5, 4, 3)
+    assert np.array_equal(observed_threads, observed)
+
+
+def test__get_thread_pool_is_created_once_under_concurrency():
+    from imgaug.imgaug import _get_thread_pool
+
+    pools = []
+
+    def _get():
+        pools.append(_get_thread_pool(7))
+
+    threads = [threading.Thread(target=_get) for _ in sm.xrange(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(pools) == 8
+    assert all([pool is pools[0] for pool in pools])
+
+
+def test_imresize_many_images_list_of_mixed_shapes_and_dtypes():
+    rng = iarandom.RNG(0)
+    images = [
+        rng.integers(0, 255, size=(8, 8, 3), dtype=np.uint8),
+        rng.integers(0, 255, size=(6, 8, 3), dtype=np.uint8),
+        rng.integers(0, 255, size=(8, 8, 3), dtype=np.uint8),
+        rng.random(size=(8, 8, 1)).astype(np.float16)
+    ]
+
+    observed = ia.imresize_many_images(images, (4, 4))
+
+    assert isinstance(observed, list)
+    for image, image_rs in zip(images, observed):
+        expected = ia.imresize_single_image(image, (4, 4))
+        assert image_rs.dtype.name == image.dtype.name
+        assert image_rs.shape == (4, 4, image.shape[2])
+        assert np.array_equal(image_rs, expected)
+
+
+def test_imresize_many_images_rowwise():
+    rng = iarandom.RNG(0)
+    images = [
+        rng.integers(0, 255, size=(8, 8, 3), dtype=np.uint8),
+        rng.integers(0, 255, size=(8, 8, 3), dtype=np.uint8),
+        rng.integers(0, 255, size=(6, 10), dtype=np.uint8),
+        rng.integers(0, 255, size=(8, 8, 3), dtype=np.uint8)
+    ]
+    sizes = [(4, 4), (4, 4), (3, 5), (8, 8)]
+    interpolations = ["linear", "nearest", "cubic", "linear"]
+
+    observed = ia.imresize_many_images_rowwise(images, sizes,
+                                               interpolations)
+
+    assert isinstance(observed, list)
+    for i in sm.xrange(3):
+        expected = ia.imresize_single_image(images[i], sizes[i],
+                                            interpolation=interpolations[i])
+        assert np.array_equal(observed[i], expected)
+    # same size as input, hence not resized
+    assert observed[3] is images[3]
+
+
 def test_imresize_single_image():
     for c in [-1, 1, 3]:
         image1 = np.zeros((16, 16, abs(c)), dtype=np.uint8) + 255
@@ -1304,6 +1376,23 @@ def test_median_pool_ksize_3():
                                               10]))
 
 
+def test_median_pool_ksize_7_uint16_hist():
+    arr = np.arange(14*14).astype(np.uint16).reshape((14, 14)) * 300
+    arr[::3, ::2] = 0
+
+    cnames = ["imgaug.imgaug._NUMBA_INSTALLED",
+              "imgaug.augmenters.blur._NUMBA_INSTALLED"]
+    with temporary_constants(cnames, [True, True]):
+        arr_pooled = ia.median_pool(arr, 7)
+
+    assert arr_pooled.shape == (2, 2)
+    assert arr_pooled.dtype.name == "uint16"
+    for y in sm.xrange(2):
+        for x in sm.xrange(2):
+            block = arr[y*7:(y+1)*7, x*7:(x+1)*7]
+            assert arr_pooled[y, x] == int(np.median(block))
+
+
 def test_median_pool_ksize_3_view():
     # After padding:
     # [5, 4, 5, 6, 7, 6],
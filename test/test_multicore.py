@@ -852,6 +852,176 @@ def _batch_loader_load_func():
 # ---------
 
 
+class TestBatchStream(unittest.TestCase):
+    @classmethod
+    def _generate_batches(cls, nb_batches, size=8):
+        for i in sm.xrange(nb_batches):
+            images = np.full((2, size, size, 3), i, dtype=np.uint8)
+            yield UnnormalizedBatch(images=images)
+
+    def test_ordered(self):
+        aug = iaa.Add(1)
+
+        stream = multicore.BatchStream(aug, self._generate_batches(20),
+                                       nb_workers=3)
+        values = [batch.images_aug[0][0, 0, 0] for batch in stream]
+
+        assert values == list(sm.xrange(1, 21))
+
+    def test_unordered(self):
+        aug = iaa.Add(1)
+
+        stream = multicore.BatchStream(aug, self._generate_batches(20),
+                                       ordered=False, nb_workers=3)
+        values = [batch.images_aug[0][0, 0, 0] for batch in stream]
+
+        assert sorted(values) == list(sm.xrange(1, 21))
+
+    def test_normalized_batches(self):
+        aug = iaa.Add(1)
+        batches = [Batch(images=np.zeros((1, 4, 4, 3), dtype=np.uint8))
+                   for _ in sm.xrange(3)]
+
+        batches_aug = list(multicore.BatchStream(aug, batches))
+
+        assert len(batches_aug) == 3
+        for batch_aug in batches_aug:
+            assert isinstance(batch_aug, Batch)
+            assert np.all(batch_aug.images_aug == 1)
+
+    def test_max_bytes_is_respected(self):
+        aug = iaa.Add(1)
+        # inputs and outputs of 2x8x8x3 images
+        batch_nbytes = 2 * (2 * 8 * 8 * 3)
+        observed = []
+        streams = []
+
+        def _gen():
+            for batch in self._generate_batches(30):
+                if streams:
+                    observed.append(streams[0].nb_bytes_in_pipeline)
+                yield batch
+
+        stream = multicore.BatchStream(aug, _gen(),
+                                       max_bytes=3 * batch_nbytes,
+                                       nb_workers=2)
+        streams.append(stream)
+        batches_aug = list(stream)
+
+        assert len(batches_aug) == 30
+        assert max(observed) <= 3 * batch_nbytes
+        assert stream.nb_bytes_in_pipeline == 0
+
+    def test_prefetch_is_respected(self):
+        aug = iaa.Add(1)
+        observed = []
+        streams = []
+
+        def _gen():
+            for batch in self._generate_batches(30):
+                if streams:
+                    # pylint: disable=protected-access
+                    observed.append(streams[0]._nb_batches_in_pipeline)
+                yield batch
+
+        stream = multicore.BatchStream(aug, _gen(), prefetch=2, nb_workers=2)
+        streams.append(stream)
+        batches_aug = list(stream)
+
+        assert len(batches_aug) == 30
+        assert max(observed) <= 2
+
+    def test_batch_larger_than_max_bytes_is_processed(self):
+        aug = iaa.Add(1)
+
+        stream = multicore.BatchStream(aug, self._generate_batches(3),
+                                       max_bytes=1)
+        batches_aug = list(stream)
+
+        assert len(batches_aug) == 3
+
+    def test_seed_makes_results_independent_of_nb_workers(self):
+        aug = iaa.AdditiveGaussianNoise(scale=(0, 50))
+
+        results = []
+        for nb_workers in [1, 3]:
+            stream = multicore.BatchStream(aug, self._generate_batches(10),
+                                           nb_workers=nb_workers, seed=1)
+            results.append([batch.images_aug for batch in stream])
+
+        for images_aug_a, images_aug_b in zip(*results):
+            assert np.array_equal(images_aug_a, images_aug_b)
+
+    def test_close_when_leaving_loop_early(self):
+        aug = iaa.Add(1)
+
+        stream = multicore.BatchStream(aug, self._generate_batches(1000),
+                                       prefetch=4, nb_workers=2)
+        gen = iter(stream)
+        for _ in sm.xrange(3):
+            _ = next(gen)
+        gen.close()
+
+        # pylint: disable=protected-access
+        assert not any([worker.is_alive() for worker in stream._workers])
+
+    def test_context_manager(self):
+        aug = iaa.Add(1)
+
+        with multicore.BatchStream(aug, self._generate_batches(1000),
+                                   prefetch=4, nb_workers=2) as stream:
+            _ = next(iter(stream))
+
+        # pylint: disable=protected-access
+        assert not any([worker.is_alive() for worker in stream._workers])
+
+    def test_error_in_worker_is_reraised(self):
+        aug = iaa.Lambda(func_images=lambda images, random_state, parents,
+                         hooks: 1/0)
+
+        stream = multicore.BatchStream(aug, self._generate_batches(5))
+
+        with self.assertRaises(ZeroDivisionError):
+            _ = list(stream)
+
+    def test_augmenter_stream(self):
+        aug = iaa.Add(1)
+
+        with aug.stream(self._generate_batches(5), max_bytes=10**6) as stream:
+            values = [batch.images_aug[0][0, 0, 0] for batch in stream]
+
+        assert values == list(sm.xrange(1, 6))
+
+
+class Test__estimate_nbytes(unittest.TestCase):
+    def test_none(self):
+        assert multicore._estimate_nbytes(None) == 0
+
+    def test_array(self):
+        arr = np.zeros((2, 4, 4, 3), dtype=np.uint8)
+        assert multicore._estimate_nbytes(arr) == 2*4*4*3
+
+    def test_coordinate_based_augmentables(self):
+        shape = (4, 4, 3)
+        cbaois = [
+            ia.KeypointsOnImage([ia.Keypoint(x=1, y=2)] * 5, shape=shape),
+            ia.BoundingBoxesOnImage(
+                [ia.BoundingBox(x1=0, y1=0, x2=1, y2=1)] * 3, shape=shape),
+            ia.PolygonsOnImage(
+                [ia.Polygon([(0, 0), (1, 0), (1, 1)])] * 2, shape=shape),
+            ia.LineStringsOnImage(
+                [ia.LineString([(0, 0), (1, 0), (2, 2)])] * 2, shape=shape)
+        ]
+
+        for cbaoi in cbaois:
+            with self.subTest(cls=cbaoi.__class__.__name__):
+                with mock.patch.object(cbaoi, "to_xy_array") as mock_xy:
+                    nbytes = multicore._estimate_nbytes([cbaoi])
+
+                assert mock_xy.call_count == 0
+                assert nbytes == cbaoi.to_xy_array().nbytes
+
+
 # Note that BatchLoader is deprecated
 class TestBatchLoader(unittest.TestCase):
     def setUp(self):